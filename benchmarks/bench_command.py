@@ -0,0 +1,39 @@
+import timeit
+
+from custom_components.ac_infinity.protocol import MODEL_DATA_REGISTERS, CommandPool, Protocol, build_command
+
+NUMBER = 200_000
+
+
+def main():
+    protocol = Protocol()
+    print(f"Command encoding ({NUMBER} iterations)")
+
+    cmd = protocol.get_model_data()
+    payload = list(cmd.command)
+    seq = iter(range(10**9))
+    legacy = timeit.timeit(lambda: build_command(bytes(payload), cmd.type, next(seq) & 0xFFFF), number=NUMBER)
+    print(f"{'build_command per send':<32} {legacy / NUMBER * 1e6:8.3f} us")
+
+    # Poll Path - What ACIBluetoothDevice.read_registers Does Per Send
+    fresh = timeit.timeit(lambda: protocol.get_model_data().compile(next(seq) & 0xFFFF), number=NUMBER)
+    print(f"{'new read Command + compile':<32} {fresh / NUMBER * 1e6:8.3f} us")
+
+    pool = CommandPool()
+    key = (tuple(MODEL_DATA_REGISTERS), None)
+
+    def pooled():
+        read = pool.take(key, protocol.get_model_data)
+        read.compile(next(seq) & 0xFFFF)
+        pool.give(key, read)
+
+    reused = timeit.timeit(pooled, number=NUMBER)
+    print(f"{'pooled read Command + compile':<32} {reused / NUMBER * 1e6:8.3f} us")
+
+    # Write Path - Values Differ Per Call, Frame Templates Are Still Cached
+    write = timeit.timeit(lambda: protocol.set_on_speed(5).compile(next(seq) & 0xFFFF), number=NUMBER)
+    print(f"{'new write Command + compile':<32} {write / NUMBER * 1e6:8.3f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import timeit
+
+from custom_components.ac_infinity.crc import crc16, crc16_table
+from custom_components.ac_infinity.protocol import build_command, validate_frame
+
+MODEL_DATA = bytes.fromhex(
+    "A5 13 00 2A 00 03 37 D5 00 01 10 01 01 11 01 02 12 01 08 13 07 00 09 74 86 0C 79 8C "
+    "14 04 00 00 01 2C 15 04 00 00 01 2C 16 08 00 00 01 2C 00 00 01 2C 17 00 C7 6D"
+)
+NUMBER = 100_000
+
+
+def legacy_crc16(d, i, n):
+    b = 0xffff
+    for k in range(i, i + n):
+        b2 = (((b << 8) | (b >> 8)) & 0xffff) ^ (d[k] & 0xff)
+        b3 = b2 ^ ((b2 & 0xff) >> 4)
+        b4 = b3 ^ ((b3 << 12) & 0xffff)
+        b = b4 ^ (((b4 & 0xff) << 5) & 0xffff)
+    return b
+
+
+def report(name: str, stmt):
+    elapsed = timeit.timeit(stmt, number=NUMBER)
+    print(f"{name:<28} {elapsed / NUMBER * 1e6:8.3f} us")
+
+
+def main():
+    view = memoryview(MODEL_DATA)
+    body = view[8:-2]
+    print(f"CRC over {len(body)} byte model data body ({NUMBER} iterations)")
+    report("legacy bitwise", lambda: legacy_crc16(MODEL_DATA, 8, len(body)))
+    report("table", lambda: crc16_table(body))
+    report("binascii", lambda: crc16(body))
+    print()
+    report("build_command", lambda: build_command(bytes([16, 1, 2]), 3, 1))
+    report("validate_frame", lambda: validate_frame(MODEL_DATA))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import logging
+import timeit
+
+from custom_components.ac_infinity.decoder import ADVERTISEMENT_FIELDS, ADVERTISEMENT_VALUES
+from custom_components.ac_infinity.frame_cache import FrameCache
+from custom_components.ac_infinity.models import DataSource, DeviceMode, DeviceType, RampStatus
+from custom_components.ac_infinity.protocol import Protocol
+from custom_components.ac_infinity.state import ACIDeviceState
+from custom_components.ac_infinity.utils import format_as_hex
+
+STATUS = bytearray.fromhex("1E FF 02 09 03 0C 00 00 07 E4 00 00 00 00 27 10 80 32")
+ADVERTISEMENT = bytes.fromhex("A4 C1 38 5F 42 9B 53 34 30 42 4D 03 06 00 05 CD 00 00 04 00 00 00 00 00 00 00 00")
+NUMBER = 200_000
+
+logger = logging.getLogger("bench")
+
+
+def legacy_process_status(data: bytes, state: ACIDeviceState) -> bool:
+    if len(data) != 18:
+        return False
+    state.is_farenheight = not bool(data[6] & (1 << 7))
+    temp_raw = int.from_bytes(data[8:10], 'big')
+    state.temperature = temp_raw / 100.0
+    state.fan_speed = data[17] >> 4
+    try:
+        state.ramp_status = RampStatus(data[16] >> 4)
+    except ValueError:
+        state.ramp_status = RampStatus.NONE
+    try:
+        state.mode = DeviceMode(data[17] & 0x0F)
+    except ValueError:
+        state.mode = DeviceMode.OFF
+    logger.debug("updated state via status: %s" % format_as_hex(data))
+    return True
+
+
+def legacy_process_advertisement(data: bytes, state: ACIDeviceState) -> bool:
+    if len(data) != 27:
+        return False
+    try:
+        device = DeviceType(data[12])
+    except ValueError:
+        return False
+    device_id = "{}-{}".format(device.prefix, data[6:11].decode('ascii'))
+    device_name = "{} ({})".format(device, device_id)
+    temp_raw = int.from_bytes(data[14:16], 'big')
+    state.id = device_id
+    state.name = device_name
+    state.model = device.model
+    state.fan_speed = data[18] & 0x0F
+    state.temperature = temp_raw / 100.0
+    logger.debug("updated state via advertisement: %s" % format_as_hex(data))
+    return True
+
+
+def cached_process_advertisement(cache: FrameCache, protocol: Protocol, data: bytes, state: ACIDeviceState) -> bool:
+    if cache.is_duplicate("advertisement", data, ADVERTISEMENT_VALUES(state)):
+        state.touch(DataSource.ADVERTISEMENT, ADVERTISEMENT_FIELDS)
+        return False
+    if protocol.process_advertisement(data, state):
+        cache.store("advertisement", data, ADVERTISEMENT_VALUES(state))
+        return True
+    return False
+
+
+def report(name: str, stmt):
+    elapsed = timeit.timeit(stmt, number=NUMBER)
+    print(f"{name:<32} {elapsed / NUMBER * 1e6:8.3f} us")
+
+
+def main():
+    protocol = Protocol(logger)
+    state = ACIDeviceState()
+    print(f"Frame decoding ({NUMBER} iterations, debug logging disabled)")
+    report("legacy status (bytes copy)", lambda: legacy_process_status(bytes(STATUS), state))
+    report("status (memoryview)", lambda: protocol.process_status(memoryview(STATUS), state))
+    report("legacy advertisement", lambda: legacy_process_advertisement(ADVERTISEMENT, state))
+    report("advertisement", lambda: protocol.process_advertisement(ADVERTISEMENT, state))
+    cache = FrameCache()
+    report("advertisement (duplicate)", lambda: cached_process_advertisement(cache, protocol, ADVERTISEMENT, state))
+
+
+if __name__ == "__main__":
+    main()
@@ -14,7 +14,7 @@ from textual.containers import Horizontal, Vertical, ScrollableContainer
 from textual.widgets import Static, Input
 
 from custom_components.ac_infinity.device import ACIBluetoothDevice
-from custom_components.ac_infinity.models import DeviceMode
+from custom_components.ac_infinity.models import CommandFailed, DeviceMode
 from custom_components.ac_infinity.protocol import CMD_TYPE_READ, CMD_TYPE_WRITE, Command
 from custom_components.ac_infinity.state import ACIDeviceState
 from custom_components.ac_infinity.utils import format_as_hex
@@ -109,10 +109,14 @@ class CLI:
             cmd_type = CMD_TYPE_WRITE if command == "write" else CMD_TYPE_READ
             if sub_command is not None:
                 raw_cmd = [int(i.strip()) for i in sub_command.split(",")]
-                cmd = Command(cmd_type, raw_cmd)
+                # Raw Commands - Unknown Semantics, Never Retried
+                cmd = Command(cmd_type, raw_cmd, idempotent=False)
 
         if cmd is not None:
-            await self.device._send_command(cmd.with_callback(cmd_cb))
+            try:
+                await self.device._send_command(cmd.with_callback(cmd_cb))
+            except CommandFailed as e:
+                cb(f"ERROR: {e}")
         else:
             cb("ERROR: NOT A VALID COMMAND")
 
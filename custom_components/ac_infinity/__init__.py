@@ -1,45 +1,67 @@
 import logging
 
+from dataclasses import asdict
+
 from homeassistant.components import bluetooth
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS, CONF_SERVICE_DATA
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.storage import Store
 
-from .consts import DOMAIN
+from .arbiter import ConnectionArbiter
+from .consts import CONF_WRITE_WITHOUT_RESPONSE, DATA_ARBITER, DOMAIN, STORAGE_VERSION
 from .device import ACIDeviceState
 from .coordinator import ACICoordinator
+from .publish import PublishPolicy
 
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.FAN,
                              Platform.NUMBER, Platform.SWITCH, Platform.CLIMATE]
 
+# Seconds Between Persisting Changed State
+CACHE_SAVE_DELAY = 60
+
+
+def _state_store(hass: HomeAssistant, entry: ConfigEntry) -> Store[dict]:
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}")
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Get Device Configuration
     address: str = entry.data[CONF_ADDRESS]
     raw_data = entry.data[CONF_SERVICE_DATA]
     if isinstance(raw_data, dict):
-        state = ACIDeviceState(**raw_data)
+        state = ACIDeviceState.from_dict(raw_data)
     else:
         state = raw_data
 
+    # Start From Last Known State
+    store = _state_store(hass, entry)
+    if cached := await store.async_load():
+        state = ACIDeviceState.from_dict(cached)
+
     # Get BLEDevice
     ble_device = bluetooth.async_ble_device_from_address(hass, address.upper(), True)
     if not ble_device:
         raise ConfigEntryNotReady(f"Could not get AC Infinity device with address {address}")
 
-    # Setup Coordinator
+    # Setup Coordinator - Connection Slots Shared Across Entries
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    arbiter = domain_data.setdefault(DATA_ARBITER, ConnectionArbiter(logger=logging.getLogger(f"{DOMAIN}.arbiter")))
     device_logger = logging.getLogger(f"{DOMAIN}.{entry.entry_id}")
-    coordinator = ACICoordinator(hass, ble_device, state, device_logger)
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    policy = PublishPolicy.from_options(entry.options)
+    write_without_response = entry.options.get(CONF_WRITE_WITHOUT_RESPONSE, False)
+    coordinator = ACICoordinator(hass, ble_device, state, device_logger, arbiter, policy, write_without_response)
+    domain_data[entry.entry_id] = coordinator
 
-    # Get Initial Data
-    try:
-        await coordinator.bt.update_model_data()
-    except:
-        raise ConfigEntryNotReady(f"Could not get AC Infinity device data with address {address}")
+    # Get Initial Data In Background - Entities Unavailable Until Read
+    entry.async_create_background_task(hass, coordinator.async_initial_refresh(), f"{DOMAIN} initial refresh {address}")
+
+    # Persist Changes For The Next Start
+    entry.async_on_unload(coordinator.async_add_field_listener(
+        lambda: store.async_delay_save(lambda: asdict(state), CACHE_SAVE_DELAY), None))
 
     entry.async_on_unload(coordinator.async_start())
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
@@ -50,12 +72,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     coordinator: ACICoordinator = hass.data[DOMAIN][entry.entry_id]
-    if entry.title != f"{coordinator.state.id} ({coordinator.address})":
+    coordinator.publish_policy = PublishPolicy.from_options(entry.options)
+
+    # Write Mode Is Fixed When The Client Is Created
+    write_without_response = entry.options.get(CONF_WRITE_WITHOUT_RESPONSE, False)
+    if (write_without_response != coordinator.write_without_response or
+            entry.title != f"{coordinator.state.id} ({coordinator.address})"):
         await hass.config_entries.async_reload(entry.entry_id)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: ACICoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    await _state_store(hass, entry).async_remove()
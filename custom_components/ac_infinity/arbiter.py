@@ -0,0 +1,204 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+
+from dataclasses import dataclass
+from logging import Logger
+from typing import Any, Protocol
+
+from .scheduler import PRIORITY_BACKGROUND
+
+# ESPHome proxies default to three connection slots, local BlueZ adapters allow more
+PROXY_SLOTS = 3
+LOCAL_SLOTS = 5
+DEFAULT_ADAPTER = "default"
+
+
+class ConnectionHolder(Protocol):
+    adapter: str
+    adapter_slots: int
+
+    @property
+    def is_idle(self) -> bool: ...
+
+    def preempt(self) -> None: ...
+
+
+def adapter_of(details: Any) -> str:
+    """
+    Adapter or proxy a device is reached through, as recorded by Home
+    Assistant in the BLEDevice details.
+    """
+    if isinstance(details, dict) and (source := details.get("source")):
+        return str(source)
+    return DEFAULT_ADAPTER
+
+
+def slots_of(details: Any) -> int:
+    """
+    Connection slots of the adapter a device is reached through. Local BlueZ
+    adapters record the D-Bus object path, proxies do not.
+    """
+    if isinstance(details, dict) and "path" in details:
+        return LOCAL_SLOTS
+    return PROXY_SLOTS
+
+
+@dataclass
+class AdapterStats:
+    slots: int
+    connected: int = 0
+    waiting: int = 0
+    grants: int = 0
+    preemptions: int = 0
+    max_wait: float = 0
+    busy_time: float = 0
+    started: float = 0
+
+    @property
+    def utilization(self) -> float:
+        elapsed = time.monotonic() - self.started
+        if elapsed <= 0:
+            return 0
+        return self.busy_time / (self.slots * elapsed)
+
+
+class _Adapter:
+    __slots__ = ("holders", "waiters", "preempting", "stats", "updated")
+
+    def __init__(self, slots: int):
+        # Holder -> Priority It Was Granted At
+        self.holders: dict[ConnectionHolder, int] = {}
+        self.waiters: list[tuple[int, int, asyncio.Future[None], ConnectionHolder]] = []
+        self.preempting: set[ConnectionHolder] = set()
+        self.stats = AdapterStats(slots, started=time.monotonic())
+        self.updated = self.stats.started
+
+    def account(self) -> None:
+        now = time.monotonic()
+        self.stats.busy_time += len(self.holders) * (now - self.updated)
+        self.stats.connected = len(self.holders)
+        self.stats.waiting = len(self.waiters)
+        self.updated = now
+
+
+class ConnectionArbiter:
+    """
+    Integration wide limit on concurrent connections per adapter. Devices
+    wait for a slot lowest priority value first and in arrival order within a
+    priority. While devices wait, connected devices with nothing in flight are
+    asked to disconnect and hand their slot on, unless they were granted at a
+    higher priority than the first waiter. Slots default to those of the
+    adapter type the first holder reports, unless fixed for all adapters.
+    """
+
+    def __init__(self, slots: int | None = None, logger: Logger | None = None):
+        self.logger = logger or logging.getLogger(__name__)
+        self._slots = slots
+        self._adapters: dict[str, _Adapter] = {}
+        self._order = itertools.count()
+
+    @property
+    def stats(self) -> dict[str, AdapterStats]:
+        for adapter in self._adapters.values():
+            adapter.account()
+        return {name: adapter.stats for name, adapter in self._adapters.items()}
+
+    def adapter_stats(self, name: str) -> AdapterStats | None:
+        if (adapter := self._adapters.get(name)) is None:
+            return None
+        adapter.account()
+        return adapter.stats
+
+    def _adapter(self, holder: ConnectionHolder) -> _Adapter:
+        if (adapter := self._adapters.get(holder.adapter)) is None:
+            slots = self._slots or holder.adapter_slots
+            adapter = self._adapters[holder.adapter] = _Adapter(slots)
+            self.logger.debug("tracking %d connection slot(s) on %s", slots, holder.adapter)
+        return adapter
+
+    async def acquire(self, holder: ConnectionHolder, priority: int = PRIORITY_BACKGROUND) -> None:
+        adapter = self._adapter(holder)
+        if holder in adapter.holders:
+            return
+
+        started = time.monotonic()
+        if len(adapter.holders) < adapter.stats.slots and not adapter.waiters:
+            self._grant(adapter, holder, priority)
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        entry = (priority, next(self._order), future, holder)
+        heapq.heappush(adapter.waiters, entry)
+        adapter.account()
+        self.logger.debug("waiting for connection slot on %s: %d waiting", holder.adapter, len(adapter.waiters))
+        self._preempt_idle(adapter)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release(holder)
+            else:
+                adapter.waiters.remove(entry)
+                heapq.heapify(adapter.waiters)
+                adapter.account()
+            raise
+        adapter.stats.max_wait = max(adapter.stats.max_wait, time.monotonic() - started)
+
+    def release(self, holder: ConnectionHolder) -> None:
+        adapter = self._adapter(holder)
+        if holder not in adapter.holders:
+            return
+        adapter.account()
+        del adapter.holders[holder]
+        adapter.preempting.discard(holder)
+
+        while adapter.waiters:
+            priority, _, future, waiter = heapq.heappop(adapter.waiters)
+            if not future.done():
+                self._grant(adapter, waiter, priority)
+                future.set_result(None)
+                break
+        adapter.account()
+        self._preempt_idle(adapter)
+
+    def idle(self, holder: ConnectionHolder) -> None:
+        """
+        Called when a holder has nothing left in flight.
+        """
+        adapter = self._adapter(holder)
+        if holder in adapter.holders and adapter.waiters and self._outranked(adapter, holder):
+            # Holders Busy When First Asked Are Asked Again
+            adapter.preempting.discard(holder)
+            self._preempt(adapter, holder)
+
+    def _grant(self, adapter: _Adapter, holder: ConnectionHolder, priority: int) -> None:
+        adapter.account()
+        adapter.holders[holder] = priority
+        adapter.stats.grants += 1
+        adapter.account()
+
+    def _preempt_idle(self, adapter: _Adapter) -> None:
+        # One Preemption Per Waiter Not Already Covered
+        needed = len(adapter.waiters) - len(adapter.preempting)
+        for holder in list(adapter.holders):
+            if needed <= 0:
+                break
+            if holder.is_idle and holder not in adapter.preempting and self._outranked(adapter, holder):
+                self._preempt(adapter, holder)
+                needed -= 1
+
+    @staticmethod
+    def _outranked(adapter: _Adapter, holder: ConnectionHolder) -> bool:
+        # Background Waiters Never Evict A Connection Granted For Interactive Work
+        return adapter.waiters[0][0] <= adapter.holders[holder]
+
+    def _preempt(self, adapter: _Adapter, holder: ConnectionHolder) -> None:
+        if holder in adapter.preempting:
+            return
+        adapter.preempting.add(holder)
+        adapter.stats.preemptions += 1
+        self.logger.debug("preempting idle connection on %s", holder.adapter)
+        holder.preempt()
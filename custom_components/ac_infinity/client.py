@@ -1,15 +1,40 @@
 import asyncio
 import logging
+import statistics
+import time
 
-from typing import Callable
+from collections import deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import Enum
+from typing import AsyncIterator, Callable
 from bleak_retry_connector import BleakClientWithServiceCache, establish_connection
 from bleak.backends.device import BLEDevice
 
-from .protocol import Command
-from .utils import format_as_hex
+from .arbiter import AdapterStats, ConnectionArbiter, adapter_of, slots_of
+from .deadline import DeadlineTracker
+from .metrics import LinkMetrics
+from .models import CommandFailed, Register
+from .protocol import CMD_TYPE_READ, CMD_TYPE_WRITE, Command, FrameReassembler
+from .retry import IDEMPOTENT_RETRY, NO_RETRY, RetryPolicy, RTTEstimator
+from .scheduler import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, CommandScheduler
+from .utils import Buffer, format_as_hex
 
 DISCONNECT_TIMEOUT = 30
 RESPONSE_TIMEOUT = 5
+PIPELINE_WINDOW = 4
+SEQ_MASK = 0xFFFF
+
+# Readiness - Wait for an unsolicited notification, then probe, within READY_TIMEOUT
+READY_STATUS_WAIT = 0.5
+READY_TIMEOUT = 2
+
+# Adaptive Policy - Seconds of idle link considered as costly as one second of connecting
+ADAPTIVE_HOLD_RATIO = 30
+ADAPTIVE_MIN_IDLE = 5
+ADAPTIVE_MAX_IDLE = 300
+ADAPTIVE_BURST_GAP = 1
 
 WRITE_CHAR = "70d51001-2c7f-4e75-ae8a-d758951ce4e0"
 READ_NOTIFY_CHAR = "70d51002-2c7f-4e75-ae8a-d758951ce4e0"
@@ -17,13 +42,51 @@ READ_NOTIFY_CHAR = "70d51002-2c7f-4e75-ae8a-d758951ce4e0"
 WRITE_RESPONSE_HEADER = bytes([0xA5, 0x13, 0x00])
 NOTIFY_STATUS_HEADER = bytes([0x1E, 0xFF, 0x02])
 
+# Write Without Response - Fall back to acknowledged writes after consecutive misses
+FAST_WRITE_MAX_MISSES = 2
+
+# Clients leased by the current task, inherited by the tasks it starts
+_leased: ContextVar[frozenset["Client"]] = ContextVar("aci_leased", default=frozenset())
+
+# Reads and absolute value writes are idempotent and safe to retry
+RETRY_POLICIES: dict[int, RetryPolicy] = {
+    CMD_TYPE_READ: IDEMPOTENT_RETRY,
+    CMD_TYPE_WRITE: IDEMPOTENT_RETRY,
+}
+
+
+class ConnectionPolicy(Enum):
+    ALWAYS = "always"
+    IDLE_TIMEOUT = "idle_timeout"
+    ADAPTIVE = "adaptive"
+
+
+@dataclass
+class ConnectionStats:
+    connects: int = 0
+    idle_disconnects: int = 0
+    preempted_disconnects: int = 0
+    keep_alive_decisions: int = 0
+    short_idle_decisions: int = 0
+    last_connect_time: float | None = None
+    last_ready_time: float | None = None
+    ready_timeouts: int = 0
+    last_idle_timeout: float | None = None
+    expected_gap: float | None = None
+
 
 class Client:
     def __init__(
             self,
             ble_device: BLEDevice,
-            on_status_update: Callable[[bytes], None],
+            on_status_update: Callable[[Buffer], None],
             logger: logging.Logger | None,
+            policy: ConnectionPolicy = ConnectionPolicy.IDLE_TIMEOUT,
+            idle_timeout: float = DISCONNECT_TIMEOUT,
+            window: int = PIPELINE_WINDOW,
+            retry_policies: dict[int, RetryPolicy] | None = None,
+            arbiter: ConnectionArbiter | None = None,
+            write_without_response: bool = False,
     ):
         self.logger = logger or logging.getLogger(__name__)
         self._ble_device = ble_device
@@ -33,53 +96,221 @@ class Client:
         self._on_status_update = on_status_update
         self._loop = asyncio.get_running_loop()
         self._connect_lock: asyncio.Lock = asyncio.Lock()
-        self._seq_lock: asyncio.Lock = asyncio.Lock()
+        self._scheduler = CommandScheduler(window)
+        self._queued_reads: dict[tuple[int, bytes], asyncio.Task[Buffer | None]] = {}
+        self.queue_stats = self._scheduler.stats
+        self._retry_policies = retry_policies or RETRY_POLICIES
+        self.rtt = RTTEstimator(RESPONSE_TIMEOUT)
         self._disconnect_timer: asyncio.TimerHandle | None = None
-        self._response_futures: dict[int, asyncio.Future[bytes]] = {}
+        self._outstanding = DeadlineTracker[Buffer](self._loop)
+        self._reassembler = FrameReassembler()
+        self._ready = asyncio.Event()
+
+        self.policy = policy
+        self.connection_stats = ConnectionStats()
+        self.metrics = LinkMetrics()
+        self._idle_timeout = idle_timeout
+        self._last_activity: float | None = None
+        self._gaps: deque[float] = deque(maxlen=8)
 
-    async def send(self, command: Command) -> bytes | None:
-        # Ensure Connection & Update Sequence
+        self._arbiter = arbiter
+        self.adapter = adapter_of(ble_device.details)
+        self.adapter_slots = slots_of(ble_device.details)
+        self._active = 0
+        self._leases = 0
+
+        self._write_without_response = write_without_response
+        self._fast_writes = False
+        self._fast_write_misses = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return self._scheduler.depth
+
+    @property
+    def outstanding(self) -> int:
+        return len(self._outstanding)
+
+    @property
+    def is_idle(self) -> bool:
+        return self._active == 0 and self._leases == 0
+
+    @property
+    def adapter_stats(self) -> AdapterStats | None:
+        return self._arbiter.adapter_stats(self.adapter) if self._arbiter else None
+
+    def preempt(self) -> None:
+        self._loop.create_task(self._execute_disconnect(preempted=True))
+
+    @asynccontextmanager
+    async def lease(self, priority: int = PRIORITY_INTERACTIVE) -> AsyncIterator["Client"]:
+        """
+        Pin the connection for a multi-step transaction. The idle timer and
+        arbiter preemption are suspended until the outermost lease exits, and
+        sends from the leasing task skip the connect lock while the link is up.
+        Other tasks keep sending as usual - a lease pins the link, it does not
+        make the transaction exclusive.
+        """
+        self._leases += 1
+        token = _leased.set(_leased.get() | {self})
         try:
-            await self._ensure_connected()
-        except Exception as e:
-            self.logger.error("failed to to send command: %s", e)
-            return
+            # Connect Failures Are Left To The Retrying Sends Within
+            try:
+                await self._ensure_connected(priority)
+            except Exception as e:
+                self.logger.warning("failed to connect for lease: %s", e)
+            if self._disconnect_timer:
+                self._disconnect_timer.cancel()
+                self._disconnect_timer = None
+            yield self
+        finally:
+            _leased.reset(token)
+            self._leases -= 1
+            if self._leases == 0:
+                self._released()
 
-        # Increment Sequence
-        async with self._seq_lock:
-            seq = self._seq
-            self._seq += 1
+    async def close(self) -> None:
+        """
+        Disconnect for good and hand the connection slot back.
+        """
+        if self._disconnect_timer:
+            self._disconnect_timer.cancel()
+            self._disconnect_timer = None
+        async with self._connect_lock:
+            try:
+                if self._client.is_connected:
+                    await self._client.disconnect()
+            except Exception as e:
+                self.logger.warning("failed to disconnect: %s", e)
+            finally:
+                self._outstanding.cancel_all(ConnectionError("closed"))
+                if self._arbiter:
+                    self._arbiter.release(self)
 
-        # Command - No Callback
-        if not command.has_callbacks():
-            await self._client.write_gatt_char(WRITE_CHAR, command.compile(seq), True)
-            self.logger.debug("sent command without callback(s) for seq-%d", seq)
+    def _released(self) -> None:
+        if not self.is_idle:
             return
+        if self._client.is_connected:
+            self._reset_disconnect_timer()
+        if self._arbiter:
+            self._arbiter.idle(self)
 
-        # Create Future
-        future = asyncio.Future[bytes]()
-        self._response_futures[seq] = future
-
-        # Send & Wait
-        await self._client.write_gatt_char(WRITE_CHAR, command.compile(seq), True)
-        self.logger.debug("sent command with callback(s) for seq-%d", seq)
+    async def send(self, command: Command) -> Buffer | None:
+        self._record_activity()
+        self._active += 1
         try:
-            resp = await asyncio.wait_for(future, timeout=RESPONSE_TIMEOUT)
+            return await self._send(command)
+        finally:
+            self._active -= 1
+            self._released()
+
+    async def _send(self, command: Command) -> Buffer | None:
+
+        # Collapse Duplicate Reads - Join An Identical Read Still Waiting For A Slot
+        if command.type == CMD_TYPE_READ and command.has_callbacks():
+            key = (command.get_priority(), bytes(command.command))
+            if (queued := self._queued_reads.get(key)) is not None:
+                self.queue_stats.collapsed_reads += 1
+                self.logger.debug("collapsed duplicate read of registers %s", command.registers)
+                return await asyncio.shield(queued)
+            task = self._loop.create_task(self._send_with_retry(command, key))
+            self._queued_reads[key] = task
+            task.add_done_callback(lambda t: self._dequeue_read(key, t))
+            return await asyncio.shield(task)
+
+        return await self._send_with_retry(command)
+
+    def _dequeue_read(self, key: tuple[int, bytes], task: asyncio.Task | None) -> None:
+        if self._queued_reads.get(key) is task:
+            del self._queued_reads[key]
+
+    async def _send_with_retry(self, command: Command, read_key: tuple[int, bytes] | None = None) -> Buffer | None:
+        policy = self._retry_policies.get(command.type, NO_RETRY) if command.idempotent else NO_RETRY
+        error: Exception | None = None
+
+        for attempt in range(policy.attempts):
+            if attempt > 0:
+                delay = policy.backoff(attempt)
+                self.logger.debug("retrying command in %.2fs (attempt %d/%d)", delay, attempt + 1, policy.attempts)
+                await asyncio.sleep(delay)
+            try:
+                return await self._send_once(command, attempt == 0, read_key)
+            except Exception as e:
+                self.logger.warning("command attempt %d/%d failed: %s", attempt + 1, policy.attempts, str(e) or type(e).__name__)
+                error = e
+
+        raise CommandFailed(f"command failed after {policy.attempts} attempt(s): {str(error) or type(error).__name__}") from error
+
+    async def _send_once(self, command: Command, sample_rtt: bool, read_key: tuple[int, bytes] | None) -> Buffer | None:
+        # Ensure Connection - Links Leased By This Task Are Already Up
+        if not (self in _leased.get() and self._client.is_connected):
+            await self._ensure_connected(command.get_priority())
+
+        # Flow Control - At Most Window Commands In Flight, Interactive First
+        async with self._scheduler.slot(command.get_priority()):
+            # Sent Reads May Predate Later Writes - No Longer Joinable
+            if read_key is not None:
+                self._dequeue_read(read_key, asyncio.current_task())
+            seq = self._next_seq()
+
+            # Command - No Callback
+            if not command.has_callbacks():
+                await self._client.write_gatt_char(WRITE_CHAR, command.compile(seq), True)
+                self.logger.debug("sent command without callback(s) for seq-%d", seq)
+                return None
+
+            # Track Future - Expired By The Shared Deadline Timer
+            timeout = self.rtt.rto
+            future = self._outstanding.add(seq, timeout)
+
+            # Send & Wait - Reply Notification Confirms Unacknowledged Writes
+            fast = self._fast_writes
+            try:
+                sent = time.monotonic()
+                await self._client.write_gatt_char(WRITE_CHAR, command.compile(seq), not fast)
+                self.logger.debug("sent command with callback(s) for seq-%d", seq)
+                resp = await future
+            except asyncio.TimeoutError:
+                self.metrics.timeouts += 1
+                self.rtt.backoff()
+                if fast:
+                    self._fast_write_missed()
+                raise asyncio.TimeoutError(f"no response for seq-{seq} within {timeout:.2f}s")
+            finally:
+                self._outstanding.discard(seq, future)
+
+            if fast:
+                self._fast_write_misses = 0
+
+            # Karn's Algorithm - Only Sample Unambiguous Responses
+            if sample_rtt:
+                elapsed = time.monotonic() - sent
+                self.rtt.sample(elapsed)
+                self.metrics.rtt.record(elapsed)
             self.logger.debug("received command response for seq-%d: length: %d", seq, len(resp))
             return resp
-        except Exception:
-            self.logger.error("failed to receive command response for seq-%d", seq)
-        finally:
-            self._response_futures.pop(seq, None)
 
-    async def _ensure_connected(self):
+    def _next_seq(self) -> int:
+        # 16 Bit Wraparound - Skip Sequences Still Awaiting A Response
+        seq = self._seq
+        while seq in self._outstanding:
+            seq = (seq + 1) & SEQ_MASK
+        self._seq = (seq + 1) & SEQ_MASK
+        return seq
+
+    async def _ensure_connected(self, priority: int = PRIORITY_BACKGROUND):
         async with self._connect_lock:
             if self._client and self._client.is_connected:
                 self._reset_disconnect_timer()
                 self.logger.debug("already connected")
                 return
 
+            # Connection Slot - Shared Across Devices On The Adapter
+            if self._arbiter:
+                await self._arbiter.acquire(self, priority)
+
             self.logger.debug("connecting")
+            started = time.monotonic()
             try:
                 self._client = await establish_connection(
                     BleakClientWithServiceCache,
@@ -87,45 +318,169 @@ class Client:
                     self._ble_device.address,
                     use_services_cache=True,
                     ble_device_callback=lambda: self._ble_device,
+                    disconnected_callback=self._on_disconnected,
                 )
                 if not self._client.is_connected:
                     raise
             except Exception as e:
                 self.logger.error("failed to connect: %s", e)
+                if self._arbiter:
+                    self._arbiter.release(self)
                 raise
             self.logger.debug("successfully connected")
 
             self._reset_disconnect_timer()
+            self._reassembler.reset()
+            self._ready.clear()
+            self._fast_writes = self._write_without_response and self._supports_write_without_response()
+            self._fast_write_misses = 0
             await self._client.start_notify(READ_NOTIFY_CHAR, self._notification_handler)
             self.logger.debug("started notify")
-            await asyncio.sleep(2)
+
+            connected = time.monotonic()
+            await self._wait_ready()
+            self.connection_stats.connects += 1
+            self.connection_stats.last_ready_time = time.monotonic() - connected
+            self.connection_stats.last_connect_time = time.monotonic() - started
+            self.metrics.connect_time.record(self.connection_stats.last_connect_time)
+            self.logger.debug("ready after %.3fs", self.connection_stats.last_ready_time)
+
+    async def _wait_ready(self) -> None:
+        # Status Notifications Indicate Readiness
+        if await self._wait_event(self._ready, READY_STATUS_WAIT):
+            return
+
+        # Probe - Single Register Read, Tracked So Its Reply Is Not Unknown
+        seq = self._next_seq()
+        probe = Command(CMD_TYPE_READ, [Register.MODE])
+        future = self._outstanding.add(seq, READY_TIMEOUT - READY_STATUS_WAIT)
+        try:
+            await self._client.write_gatt_char(WRITE_CHAR, probe.compile(seq), True)
+            self.logger.debug("sent readiness probe for seq-%d", seq)
+            await future
+        except (asyncio.TimeoutError, ConnectionError):
+            self.connection_stats.ready_timeouts += 1
+            self.logger.warning("device not ready after %ds, continuing", READY_TIMEOUT)
+        finally:
+            self._outstanding.discard(seq, future)
+
+    async def _wait_event(self, event: asyncio.Event, timeout: float) -> bool:
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def _supports_write_without_response(self) -> bool:
+        try:
+            characteristic = self._client.services.get_characteristic(WRITE_CHAR)
+        except Exception:
+            characteristic = None
+        if characteristic is None or "write-without-response" not in characteristic.properties:
+            self.logger.debug("write without response not supported, using acknowledged writes")
+            return False
+        return True
+
+    def _fast_write_missed(self) -> None:
+        # Notifications Going Missing - Acknowledged Writes Until Reconnect
+        self._fast_write_misses += 1
+        if self._fast_write_misses >= FAST_WRITE_MAX_MISSES:
+            self._fast_writes = False
+            self.metrics.fast_write_fallbacks += 1
+            self.logger.warning("no reply to %d unacknowledged writes, falling back to acknowledged writes", self._fast_write_misses)
+
+    def _on_disconnected(self, _) -> None:
+        # Fail Outstanding Requests Now Rather Than At Their Deadlines
+        if count := self._outstanding.cancel_all(ConnectionError("disconnected")):
+            self.logger.debug("failed %d outstanding request(s) on disconnect", count)
+
+        # Dropped Links Hand The Slot On - No-Op Once Released Or Reconnected
+        if self._arbiter and not self._client.is_connected:
+            self._arbiter.release(self)
 
     def _notification_handler(self, _, data: bytearray):
-        header = data[:3]
-        if header == NOTIFY_STATUS_HEADER:
-            return self._on_status_update(bytes(data))
-        elif header == WRITE_RESPONSE_HEADER:
-            seq = data[5]
-            if seq in self._response_futures:
-                self.logger.debug("received write response for seq-%d", seq)
-                self._response_futures[seq].set_result(bytes(data))
+        self._ready.set()
+        self.metrics.notifications.record()
+        if data.startswith(NOTIFY_STATUS_HEADER):
+            return self._on_status_update(memoryview(data))
+
+        discarded = self._reassembler.discarded
+        for frame in self._reassembler.feed(data):
+            if frame[1] == WRITE_RESPONSE_HEADER[1]:
+                self._handle_response(frame)
             else:
-                self.logger.debug("received write response for unknown seq-%d", seq)
+                self.logger.warning("received unknown frame: %s", format_as_hex(frame))
+        if self._reassembler.discarded != discarded:
+            self.logger.warning("discarded %d byte(s) of invalid data: %s",
+                                self._reassembler.discarded - discarded, format_as_hex(data))
+
+    def _handle_response(self, frame: memoryview):
+        seq = (frame[4] << 8) | frame[5]
+        if self._outstanding.resolve(seq, frame):
+            self.logger.debug("received write response for seq-%d", seq)
         else:
-            self.logger.warning("received unknown data: %s", format_as_hex(bytes(data)))
+            self.metrics.unknown_sequence += 1
+            self.logger.debug("received write response for unknown seq-%d", seq)
+
+    def _record_activity(self) -> None:
+        # Track Gaps Between Command Bursts
+        now = time.monotonic()
+        if self._last_activity is not None and now - self._last_activity >= ADAPTIVE_BURST_GAP:
+            self._gaps.append(now - self._last_activity)
+        self._last_activity = now
+
+    def _get_idle_timeout(self) -> float | None:
+        if self.policy == ConnectionPolicy.ALWAYS:
+            return None
+        if self.policy == ConnectionPolicy.IDLE_TIMEOUT:
+            return self._idle_timeout
+
+        # Adaptive - Keep Link Until Next Expected Command If Cheaper Than Reconnecting
+        stats = self.connection_stats
+        if not self._gaps or stats.last_connect_time is None:
+            return self._idle_timeout
+        stats.expected_gap = statistics.median(self._gaps)
+        if stats.expected_gap < stats.last_connect_time * ADAPTIVE_HOLD_RATIO:
+            stats.keep_alive_decisions += 1
+            timeout = stats.expected_gap * 1.25 + stats.last_connect_time
+        else:
+            stats.short_idle_decisions += 1
+            timeout = ADAPTIVE_MIN_IDLE
+        return min(max(timeout, ADAPTIVE_MIN_IDLE), ADAPTIVE_MAX_IDLE)
 
     def _reset_disconnect_timer(self) -> None:
         if self._disconnect_timer:
             self._disconnect_timer.cancel()
-        self._disconnect_timer = self._loop.call_later(DISCONNECT_TIMEOUT, self._disconnect)
+            self._disconnect_timer = None
+        if self._leases:
+            return
+        timeout = self._get_idle_timeout()
+        self.connection_stats.last_idle_timeout = timeout
+        if timeout is not None:
+            self._disconnect_timer = self._loop.call_later(timeout, self._disconnect)
 
     def _disconnect(self) -> None:
         asyncio.create_task(self._execute_disconnect())
 
-    async def _execute_disconnect(self) -> None:
+    async def _execute_disconnect(self, preempted: bool = False) -> None:
         self.logger.debug("disconnecting")
         async with self._connect_lock:
-            if not self._client.is_connected:
+            # Busy Or Leased - Disconnect Is Reconsidered Once Idle
+            if not self.is_idle:
                 return
-            await self._client.stop_notify(READ_NOTIFY_CHAR)
-            await self._client.disconnect()
+            try:
+                if not self._client.is_connected:
+                    return
+                if preempted:
+                    self.connection_stats.preempted_disconnects += 1
+                    if self._disconnect_timer:
+                        self._disconnect_timer.cancel()
+                        self._disconnect_timer = None
+                else:
+                    self.connection_stats.idle_disconnects += 1
+                self.logger.debug("%s disconnect: %s", "preempted" if preempted else "idle", self.connection_stats)
+                await self._client.stop_notify(READ_NOTIFY_CHAR)
+                await self._client.disconnect()
+            finally:
+                if self._arbiter:
+                    self._arbiter.release(self)
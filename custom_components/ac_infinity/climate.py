@@ -6,11 +6,12 @@ from homeassistant.const import UnitOfTemperature
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from custom_components.ac_infinity.models import DeviceMode
+from custom_components.ac_infinity.models import DeviceMode, Register
 
 from .consts import DOMAIN
 from .coordinator import ACICoordinator
-from .entity import ACIEntity
+from .entity import ACIEntity, command_action
+from .publish import PublishGate
 
 
 async def async_setup_entry(
@@ -43,32 +44,38 @@ class Climate(ACIEntity, ClimateEntity):
         HVACMode.FAN_ONLY
     ]
     _attr_fan_modes = [str(mode) for mode in DeviceMode]
+    _state_fields = ("mode", "fan_speed", "temperature", "auto_high_temp_on", "auto_low_temp_on", "auto_high_temp", "auto_low_temp")
 
     def __init__(self, coordinator: ACICoordinator):
         super().__init__(coordinator)
         self.logger = coordinator.logger
         self._attr_name = f"Climate"
         self._attr_unique_id = f"{self.coordinator.state.id}_climate"
+        self._publish_gate = PublishGate()
 
+    @command_action
     async def async_turn_off(self) -> None:
         await self.coordinator.bt.turn_off()
 
+    @command_action
     async def async_turn_on(self) -> None:
         await self.coordinator.bt.set_mode(DeviceMode.AUTO_TEMP)
 
+    @command_action
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         await self.coordinator.bt.set_mode(DeviceMode.from_string(fan_mode))
 
+    @command_action
     async def async_set_temperature(self, **kwargs: Any) -> None:
-        target_high_temp: float | None = kwargs.get("target_temp_high")
-        target_low_temp: float | None = kwargs.get("target_temp_low")
-        if target_high_temp is not None and target_low_temp is not None:
-            await self.coordinator.bt.set_auto_temp(target_low_temp, target_high_temp)
-        if target_low_temp is not None:
-            await self.coordinator.bt.set_auto_low_temp(target_low_temp)
-        if target_high_temp is not None:
-            await self.coordinator.bt.set_auto_high_temp(target_high_temp)
-
+        values = {}
+        if (target_high_temp := kwargs.get("target_temp_high")) is not None:
+            values["high_temp"] = target_high_temp
+        if (target_low_temp := kwargs.get("target_temp_low")) is not None:
+            values["low_temp"] = target_low_temp
+        if values:
+            await self.coordinator.debouncer.submit(Register.AUTO, values, self.coordinator.bt.update_auto)
+
+    @command_action
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         # Set Simple On / Off
         if hvac_mode == HVACMode.OFF:
@@ -78,32 +85,47 @@ class Climate(ACIEntity, ClimateEntity):
             await self.coordinator.bt.turn_on(None)
             return
 
-        # Ensure Mode
-        state = self.coordinator.state
-        if state.mode != DeviceMode.AUTO_TEMP:
-            await self.coordinator.bt.set_mode(DeviceMode.AUTO_TEMP)
-
-        # Ensure Low / High Switches
-        if hvac_mode == HVACMode.HEAT:
-            if not state.auto_low_temp_on:
-                await self.coordinator.bt.set_auto_low_switch(True)
-            if state.auto_high_temp_on is None or state.auto_high_temp_on:
-                await self.coordinator.bt.set_auto_high_switch(False)
-        elif hvac_mode == HVACMode.COOL:
-            if state.auto_low_temp_on is None or state.auto_low_temp_on:
-                await self.coordinator.bt.set_auto_low_switch(False)
-            if not state.auto_high_temp_on:
-                await self.coordinator.bt.set_auto_high_switch(True)
-        elif hvac_mode == HVACMode.HEAT_COOL:
-            if not state.auto_low_temp_on:
-                await self.coordinator.bt.set_auto_low_switch(True)
-            if not state.auto_high_temp_on:
-                await self.coordinator.bt.set_auto_high_switch(True)
+        # Single Connection Across Mode & Switch Changes
+        async with self.coordinator.bt.transaction():
+            # Ensure Mode
+            state = self.coordinator.state
+            if state.mode != DeviceMode.AUTO_TEMP:
+                await self.coordinator.bt.set_mode(DeviceMode.AUTO_TEMP)
+
+            # Ensure Low / High Switches
+            if hvac_mode == HVACMode.HEAT:
+                if not state.auto_low_temp_on:
+                    await self.coordinator.bt.set_auto_low_switch(True)
+                if state.auto_high_temp_on is None or state.auto_high_temp_on:
+                    await self.coordinator.bt.set_auto_high_switch(False)
+            elif hvac_mode == HVACMode.COOL:
+                if state.auto_low_temp_on is None or state.auto_low_temp_on:
+                    await self.coordinator.bt.set_auto_low_switch(False)
+                if not state.auto_high_temp_on:
+                    await self.coordinator.bt.set_auto_high_switch(True)
+            elif hvac_mode == HVACMode.HEAT_COOL:
+                if not state.auto_low_temp_on:
+                    await self.coordinator.bt.set_auto_low_switch(True)
+                if not state.auto_high_temp_on:
+                    await self.coordinator.bt.set_auto_high_switch(True)
 
     @property
     def available(self) -> bool:  # type: ignore
         return self.coordinator.available
 
+    def _publish_key(self) -> tuple:
+        return (
+            self.available,
+            self._attr_hvac_mode,
+            self._attr_hvac_action,
+            self._attr_fan_mode,
+            self._attr_target_temperature_high,
+            self._attr_target_temperature_low,
+        )
+
+    def _publish_value(self) -> float | None:
+        return self._attr_current_temperature
+
     @callback
     def _async_update_attrs(self) -> None:
         # Validate Needed Attributes
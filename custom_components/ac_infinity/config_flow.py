@@ -1,11 +1,21 @@
 import logging
+import voluptuous as vol
 
 from homeassistant.components.bluetooth import BluetoothServiceInfoBleak
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import ConfigEntry, ConfigFlow, ConfigFlowResult, OptionsFlow
 from homeassistant.const import CONF_ADDRESS, CONF_SERVICE_DATA
+from homeassistant.core import callback
 
-from .consts import DOMAIN, MANUFACTURER_ID
+from .consts import (
+    CONF_TEMPERATURE_DEADBAND,
+    CONF_TEMPERATURE_HEARTBEAT,
+    CONF_TEMPERATURE_MIN_INTERVAL,
+    CONF_WRITE_WITHOUT_RESPONSE,
+    DOMAIN,
+    MANUFACTURER_ID,
+)
 from .protocol import Protocol
+from .publish import PublishPolicy
 from .state import ACIDeviceState
 
 
@@ -20,6 +30,11 @@ class ACIConfigFlow(ConfigFlow, domain=DOMAIN):
         self._address: str | None = None
         self._state: ACIDeviceState = ACIDeviceState()
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        return ACIOptionsFlow()
+
     async def async_step_bluetooth(self, discovery_info: BluetoothServiceInfoBleak) -> ConfigFlowResult:
         # Ensure Unique ID & Set Address
         await self.async_set_unique_id(discovery_info.address)
@@ -62,3 +77,23 @@ class ACIConfigFlow(ConfigFlow, domain=DOMAIN):
                 CONF_SERVICE_DATA: self._state,
             }
         )
+
+
+class ACIOptionsFlow(OptionsFlow):
+    async def async_step_init(self, user_input=None) -> ConfigFlowResult:
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        # Current Options As Defaults
+        policy = PublishPolicy.from_options(self.config_entry.options)
+        write_without_response = self.config_entry.options.get(CONF_WRITE_WITHOUT_RESPONSE, False)
+        schema = vol.Schema({
+            vol.Required(CONF_TEMPERATURE_DEADBAND, default=policy.deadband):
+                vol.All(vol.Coerce(float), vol.Range(min=0, max=5)),
+            vol.Required(CONF_TEMPERATURE_MIN_INTERVAL, default=policy.min_interval):
+                vol.All(vol.Coerce(float), vol.Range(min=0, max=3600)),
+            vol.Required(CONF_TEMPERATURE_HEARTBEAT, default=policy.heartbeat):
+                vol.All(vol.Coerce(float), vol.Range(min=0, max=86400)),
+            vol.Required(CONF_WRITE_WITHOUT_RESPONSE, default=write_without_response): bool,
+        })
+        return self.async_show_form(step_id="init", data_schema=schema)
@@ -0,0 +1,201 @@
+import asyncio
+
+import pytest
+
+from . import client as client_module
+from .arbiter import PROXY_SLOTS, ConnectionArbiter
+from .protocol import CMD_TYPE_READ, CMD_TYPE_WRITE, Command, build_command, patch_sequence
+from .state import ACIDeviceState
+from .utils import Buffer
+
+STATUS_NOTIFICATION = bytes([0x1E, 0xFF, 0x02, 0x09, 0x03, 0x0C, 0x00, 0x00,
+                             0x07, 0xE4, 0x00, 0x00, 0x00, 0x00, 0x27, 0x10, 0x80, 0x32])
+
+# Register -> Value Reported By Fake Devices
+REGISTER_VALUES: dict[int, list[int]] = {
+    16: [2],
+    17: [1],
+    18: [5],
+    19: [0x0C, 86, 30, 68, 20, 0, 0],
+    20: [0, 0, 0, 0],
+    21: [0, 0, 0, 0],
+    22: [0, 0, 0, 60, 0, 0, 0, 120],
+    23: [],
+}
+
+
+def response_frame(seq: int, registers: list[int]) -> bytearray:
+    body = []
+    for register in registers:
+        value = REGISTER_VALUES.get(register, [])
+        body += [register, len(value), *value]
+    frame = bytearray(build_command(bytes(body), CMD_TYPE_READ, seq))
+    frame[1] = 0x13
+    patch_sequence(frame, seq)
+    return frame
+
+
+class FakeBLEDevice:
+    def __init__(self, address: str = "AA:BB:CC:DD:EE:FF"):
+        self.address = address
+        self.details: dict = {}
+
+
+class FakeCharacteristic:
+    def __init__(self, properties: list[str]):
+        self.properties = properties
+
+
+class FakeServices:
+    def __init__(self, properties: list[str]):
+        self._characteristic = FakeCharacteristic(properties)
+
+    def get_characteristic(self, _):
+        return self._characteristic
+
+
+class FakeBleakClient:
+    """
+    Bleak client that answers every command frame with a response echoing
+    its sequence after rtt. Replies to the next `drop` frames are withheld,
+    and `drop_link()` disconnects as the peer would.
+    """
+
+    def __init__(self):
+        self.is_connected = False
+        self.connects = 0
+        self.rtt = 0.001
+        self.status_on_notify = True
+        self.drop = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.writes: list[tuple[bytes, bool]] = []
+        self.services = FakeServices(["write", "write-without-response", "notify"])
+        self._handler = None
+        self.disconnected_callback = None
+
+    def drop_link(self) -> None:
+        self.is_connected = False
+        if self.disconnected_callback:
+            self.disconnected_callback(self)
+
+    async def start_notify(self, _, handler) -> None:
+        self._handler = handler
+        if self.status_on_notify:
+            asyncio.get_running_loop().call_soon(self.notify, bytearray(STATUS_NOTIFICATION))
+
+    async def stop_notify(self, _) -> None:
+        self._handler = None
+
+    async def disconnect(self) -> None:
+        self.is_connected = False
+
+    async def write_gatt_char(self, _, data: Buffer, response: bool = True) -> None:
+        data = bytes(data)
+        self.writes.append((data, response))
+        if self.drop:
+            self.drop -= 1
+            return
+        seq = (data[4] << 8) | data[5]
+        registers = list(data[10:-2]) if data[9] == CMD_TYPE_READ else []
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        asyncio.get_running_loop().call_later(self.rtt, self._respond, response_frame(seq, registers))
+
+    def _respond(self, frame: bytearray) -> None:
+        self.in_flight -= 1
+        self.notify(frame)
+
+    def notify(self, data: bytearray) -> None:
+        if self._handler:
+            self._handler(None, data)
+
+
+@pytest.fixture
+def ble(monkeypatch) -> FakeBleakClient:
+    fake = FakeBleakClient()
+
+    async def establish_connection(*args, **kwargs):
+        fake.connects += 1
+        fake.is_connected = True
+        fake.disconnected_callback = kwargs.get("disconnected_callback")
+        return fake
+
+    monkeypatch.setattr(client_module, "establish_connection", establish_connection)
+    monkeypatch.setattr(client_module, "BleakClientWithServiceCache", lambda *args, **kwargs: fake)
+    return fake
+
+
+class FakeHolder:
+    """
+    Arbiter holder that releases its slot when preempted while idle.
+    """
+
+    def __init__(self, arbiter: ConnectionArbiter, name: str, adapter: str = "hci0", adapter_slots: int = PROXY_SLOTS):
+        self.arbiter = arbiter
+        self.name = name
+        self.adapter = adapter
+        self.adapter_slots = adapter_slots
+        self.is_idle = False
+        self.preempted = 0
+
+    def preempt(self) -> None:
+        self.preempted += 1
+        if self.is_idle:
+            self.arbiter.release(self)
+
+
+def make_client(**kwargs):
+    return client_module.Client(FakeBLEDevice(), kwargs.pop("on_status_update", lambda data: None), None, **kwargs)
+
+
+class FakeClient:
+    """
+    Stand-in for Client at the device level. Reads are answered from
+    REGISTER_VALUES, writes are acknowledged, `error` fails every send and
+    `write_error` only writes, and `gate` holds every send until set.
+    """
+
+    def __init__(self):
+        self.sent: list[Command] = []
+        self.error: Exception | None = None
+        self.write_error: Exception | None = None
+        self.gate: asyncio.Event | None = None
+        self._seq = 0
+
+    async def send(self, cmd: Command) -> Buffer | None:
+        self.sent.append(cmd)
+        if self.gate is not None:
+            await self.gate.wait()
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        if self.write_error is not None and cmd.type == CMD_TYPE_WRITE:
+            raise self.write_error
+        if not cmd.has_callbacks():
+            return None
+        self._seq += 1
+        registers = cmd.command if cmd.type == CMD_TYPE_READ else []
+        return memoryview(response_frame(self._seq, registers))
+
+    def lease(self):
+        return _NullLease()
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _NullLease:
+    async def __aenter__(self):
+        return None
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def make_device(**kwargs):
+    from .device import ACIBluetoothDevice
+
+    device = ACIBluetoothDevice(FakeBLEDevice(), kwargs.pop("state", None) or ACIDeviceState(), None, **kwargs)
+    device.client = FakeClient()
+    return device
@@ -1,3 +1,13 @@
 DOMAIN = "ac_infinity"
+DATA_ARBITER = "arbiter"
 MANUFACTURER_ID = 2306
+STORAGE_VERSION = 1
 PACKET_HEAD = bytes([165, 0])
+
+# Options - Temperature Publication Policy
+CONF_TEMPERATURE_DEADBAND = "temperature_deadband"
+CONF_TEMPERATURE_MIN_INTERVAL = "temperature_min_interval"
+CONF_TEMPERATURE_HEARTBEAT = "temperature_heartbeat"
+
+# Options - Connection
+CONF_WRITE_WITHOUT_RESPONSE = "write_without_response"
@@ -1,16 +1,34 @@
+import asyncio
+import time
+
 from logging import Logger
+from typing import Iterable
 from bleak.backends.device import BLEDevice
 from homeassistant.components import bluetooth
 from homeassistant.components.bluetooth.active_update_coordinator import ActiveBluetoothDataUpdateCoordinator
-from homeassistant.core import CoreState, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
 
+from .arbiter import ConnectionArbiter
+from .client import ConnectionPolicy
 from .consts import MANUFACTURER_ID
+from .debounce import RegisterDebouncer
+from .decoder import REGISTER_FIELDS
 from .device import ACIBluetoothDevice
+from .publish import PublishPolicy
 from .state import ACIDeviceState
 
 
+# Polling - Backs off while polls find nothing new, follows up soon after changes
+POLL_INTERVAL = 30
+MIN_POLL_INTERVAL = 5
+MAX_POLL_INTERVAL = 300
+FOLLOW_UP_DELAY = 5
+POLLED_FIELDS = tuple(key for fields in REGISTER_FIELDS.values() for key in fields)
+
+
 class ACICoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
     bt: ACIBluetoothDevice
+    debouncer: RegisterDebouncer
     state: ACIDeviceState
 
     def __init__(
@@ -19,14 +37,31 @@ class ACICoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
         device: BLEDevice,
         state: ACIDeviceState,
         logger: Logger,
+        arbiter: ConnectionArbiter | None = None,
+        publish_policy: PublishPolicy | None = None,
+        write_without_response: bool = False,
     ) -> None:
         self.state = state
+        self.publish_policy = publish_policy or PublishPolicy()
+        self.write_without_response = write_without_response
         self.bt = ACIBluetoothDevice(
             device=device,
             state=state,
             logger=logger,
-            on_state_update=self.async_update_listeners,
+            on_state_update=self._async_state_updated,
+            optimistic=True,
+            connection_policy=ConnectionPolicy.ADAPTIVE,
+            connection_arbiter=arbiter,
+            write_without_response=write_without_response,
+            on_write=self._schedule_follow_up,
         )
+        self.debouncer = RegisterDebouncer(logger)
+        self.poll_interval: float = POLL_INTERVAL
+        self._follow_up_at: float | None = None
+        self._last_mode = state.mode
+        self._initialized = False
+        self._listeners_available = False
+        self._field_listeners: list[tuple[frozenset[str] | None, CALLBACK_TYPE]] = []
 
         super().__init__(
             hass=hass,
@@ -38,11 +73,54 @@ class ACICoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
             connectable=True,
         )
 
+    @property
+    def available(self) -> bool:
+        # Cached State Only Until The Device Has Answered Once
+        return self._initialized and super().available
+
+    async def async_initial_refresh(self) -> None:
+        """
+        First model read, retried in the background until the device answers.
+        """
+        delay = FOLLOW_UP_DELAY
+        while True:
+            try:
+                await self.bt.update_model_data()
+                break
+            except Exception as e:
+                self.logger.warning("initial model read failed, retrying in %ds: %s", delay, e)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, MAX_POLL_INTERVAL)
+
+        self._initialized = True
+        self.async_update_listeners()
+
+    async def async_shutdown(self) -> None:
+        await self.debouncer.cancel()
+        await self.bt.close()
+
+    def _schedule_follow_up(self) -> None:
+        self._follow_up_at = time.monotonic() + FOLLOW_UP_DELAY
+        self.poll_interval = POLL_INTERVAL
+
+    def _polled_values(self) -> tuple:
+        return tuple(getattr(self.state, key) for key in POLLED_FIELDS)
+
     async def _do_poll(self, _) -> None:
+        self._follow_up_at = None
+        before = self._polled_values()
         try:
             await self.bt.update_model_data()
         except Exception as e:
             self.logger.error("failed to update model data: %s", e)
+            return
+
+        # Stable Devices Back Off, Changes Restore The Base Interval
+        if self._polled_values() != before:
+            self.poll_interval = POLL_INTERVAL
+        else:
+            self.poll_interval = min(self.poll_interval * 2, MAX_POLL_INTERVAL)
+        self.logger.debug("next poll in %ds", self.poll_interval)
 
     @callback
     def _needs_poll(
@@ -50,13 +128,25 @@ class ACICoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
         service_info: bluetooth.BluetoothServiceInfoBleak,
         seconds_since_last_poll: float | None,
     ) -> bool:
-        return (
-            self.hass.state == CoreState.running
-            and (seconds_since_last_poll is None or seconds_since_last_poll > 30)
-            and bool(
-                bluetooth.async_ble_device_from_address(
-                    self.hass, service_info.device.address, connectable=True)
-            )
+        if self.hass.state != CoreState.running or not self._initialized:
+            return False
+        if seconds_since_last_poll is not None and seconds_since_last_poll < MIN_POLL_INTERVAL:
+            return False
+
+        # Mode Transitions - Timers, Cycle & Auto Registers Likely Changed
+        if self.state.mode != self._last_mode:
+            self._last_mode = self.state.mode
+            self._schedule_follow_up()
+
+        # Follow Up Due, Or Interval Elapsed & Fields Not Refreshed Meanwhile
+        follow_up = self._follow_up_at is not None and time.monotonic() >= self._follow_up_at
+        interval_elapsed = seconds_since_last_poll is None or seconds_since_last_poll >= self.poll_interval
+        if not follow_up and not (interval_elapsed and not self.state.is_fresh(POLLED_FIELDS, self.poll_interval)):
+            return False
+
+        return bool(
+            bluetooth.async_ble_device_from_address(
+                self.hass, service_info.device.address, connectable=True)
         )
 
     @callback
@@ -68,6 +158,40 @@ class ACICoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
         data = service_info.advertisement.manufacturer_data.get(MANUFACTURER_ID)
         if data is None:
             self.logger.warning("no manufacturer data for %s", self.address)
-        else:
-            self.bt._update_from_advertisement_data(data)
+            super()._async_handle_bluetooth_event(service_info, change)
+            return
+
+        self.bt._update_from_advertisement_data(data)
         super()._async_handle_bluetooth_event(service_info, change)
+
+    @callback
+    def async_add_field_listener(self, update_callback: CALLBACK_TYPE, fields: Iterable[str] | None) -> CALLBACK_TYPE:
+        """
+        Listen for changes to the given state fields, or to any field if None.
+        """
+        entry = (frozenset(fields) if fields is not None else None, update_callback)
+        self._field_listeners.append(entry)
+
+        @callback
+        def remove_listener() -> None:
+            self._field_listeners.remove(entry)
+
+        return remove_listener
+
+    @callback
+    def _async_state_updated(self) -> None:
+        # Only Listeners Of Changed Fields Write State - All Are Updated Once Initialized
+        if not (changed := self.state.pop_changes()) or not self._initialized:
+            return
+        for fields, update_callback in list(self._field_listeners):
+            if fields is None or not fields.isdisjoint(changed):
+                update_callback()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        # Base Fan-Out Only When Availability Changes - Advertisements & Polls Reach
+        # Entities Through The Field Listeners Of What They Changed
+        if (available := self.available) == self._listeners_available:
+            return
+        self._listeners_available = available
+        super().async_update_listeners()
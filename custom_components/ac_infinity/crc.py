@@ -0,0 +1,38 @@
+import binascii
+
+from .utils import Buffer
+
+CRC16_INIT = 0xFFFF
+
+
+def _build_table(poly: int) -> tuple[int, ...]:
+    table = []
+    for i in range(256):
+        crc = i << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ poly) if crc & 0x8000 else (crc << 1)
+        table.append(crc & 0xFFFF)
+    return tuple(table)
+
+
+# CRC-16/CCITT-FALSE (poly 0x1021, init 0xFFFF, no reflection)
+CRC16_TABLE = _build_table(0x1021)
+
+
+def crc16(data: Buffer, crc: int = CRC16_INIT) -> int:
+    """
+    Compute the packet CRC over data. Pass a previous result as crc to continue
+    an incremental computation. binascii.crc_hqx implements the same polynomial
+    in C and accepts any buffer, so memoryview slices are never copied.
+    """
+    return binascii.crc_hqx(data, crc)
+
+
+def crc16_table(data: Buffer, crc: int = CRC16_INIT) -> int:
+    """
+    Pure Python table driven reference implementation of crc16.
+    """
+    table = CRC16_TABLE
+    for b in data:
+        crc = ((crc << 8) & 0xFFFF) ^ table[(crc >> 8) ^ b]
+    return crc
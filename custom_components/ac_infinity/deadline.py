@@ -0,0 +1,93 @@
+import asyncio
+import heapq
+import itertools
+
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+# Deadlines within this of the earliest expire together
+EXPIRY_SLACK = 0.01
+
+
+class DeadlineTracker(Generic[T]):
+    """
+    Outstanding request futures keyed by sequence, ordered by deadline in a
+    heap. One timer handle is armed for the earliest deadline and expires
+    every request due by then in a single pass.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+        self._futures: dict[int, asyncio.Future[T]] = {}
+        self._deadlines: list[tuple[float, int, int, asyncio.Future[T]]] = []
+        self._order = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+        self.expired = 0
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+    def __contains__(self, seq: int) -> bool:
+        return seq in self._futures
+
+    def add(self, seq: int, timeout: float) -> asyncio.Future[T]:
+        future: asyncio.Future[T] = self._loop.create_future()
+        deadline = self._loop.time() + timeout
+        self._futures[seq] = future
+        heapq.heappush(self._deadlines, (deadline, next(self._order), seq, future))
+        if self._timer is None or deadline < self._timer.when():
+            self._arm()
+        return future
+
+    def resolve(self, seq: int, result: T) -> bool:
+        future = self._futures.pop(seq, None)
+        if future is None or future.done():
+            return False
+        future.set_result(result)
+        return True
+
+    def discard(self, seq: int, future: asyncio.Future[T]) -> None:
+        if self._futures.get(seq) is future:
+            del self._futures[seq]
+        if not future.done():
+            future.cancel()
+        if not self._futures:
+            self._clear()
+
+    def cancel_all(self, error: Exception) -> int:
+        futures = list(self._futures.values())
+        self._clear()
+        for future in futures:
+            if not future.done():
+                future.set_exception(error)
+        return len(futures)
+
+    def _clear(self) -> None:
+        self._futures.clear()
+        self._deadlines.clear()
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+    def _arm(self) -> None:
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        # Drop Entries Already Resolved Or Discarded
+        while self._deadlines and self._deadlines[0][3].done():
+            heapq.heappop(self._deadlines)
+        if self._deadlines:
+            self._timer = self._loop.call_at(self._deadlines[0][0], self._expire)
+
+    def _expire(self) -> None:
+        self._timer = None
+        due = self._loop.time() + EXPIRY_SLACK
+        while self._deadlines and self._deadlines[0][0] <= due:
+            _, _, seq, future = heapq.heappop(self._deadlines)
+            if self._futures.get(seq) is future:
+                del self._futures[seq]
+            if not future.done():
+                self.expired += 1
+                future.set_exception(asyncio.TimeoutError())
+        self._arm()
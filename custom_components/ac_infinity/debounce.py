@@ -0,0 +1,91 @@
+import asyncio
+import logging
+
+from logging import Logger
+from typing import Any, Awaitable, Callable
+
+from .models import CommandFailed
+
+DEBOUNCE_DELAY = 0.3
+
+
+class _PendingWrite:
+    __slots__ = ("apply", "values", "futures", "handle")
+
+    def __init__(self, apply: Callable[..., Awaitable[None]]):
+        self.apply = apply
+        self.values: dict[str, Any] = {}
+        self.futures: list[asyncio.Future[None]] = []
+        self.handle: asyncio.TimerHandle | None = None
+
+
+class RegisterDebouncer:
+    """
+    Last value wins debouncing of register writes. Values submitted for a
+    register within the delay are merged, newer values superseding older ones,
+    and applied once. Every submitter is resolved when the merged write is.
+    """
+
+    def __init__(self, logger: Logger | None = None, delay: float = DEBOUNCE_DELAY):
+        self.logger = logger or logging.getLogger(__name__)
+        self._delay = delay
+        self._pending: dict[int, _PendingWrite] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, register: int, values: dict[str, Any], apply: Callable[..., Awaitable[None]]) -> None:
+        loop = asyncio.get_running_loop()
+        pending = self._pending.get(register)
+        if pending is None:
+            pending = self._pending[register] = _PendingWrite(apply)
+        elif pending.handle is not None:
+            pending.handle.cancel()
+            self.logger.debug("superseded pending write for register %d", register)
+
+        pending.apply = apply
+        pending.values.update(values)
+        future: asyncio.Future[None] = loop.create_future()
+        pending.futures.append(future)
+        pending.handle = loop.call_later(self._delay, self._flush, register)
+        await future
+
+    def _flush(self, register: int) -> None:
+        pending = self._pending.pop(register)
+        task = asyncio.create_task(self._execute(register, pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def cancel(self) -> None:
+        """
+        Drop pending writes and cancel those being applied, failing their
+        submitters.
+        """
+        for pending in self._pending.values():
+            if pending.handle is not None:
+                pending.handle.cancel()
+            self._fail(pending, CommandFailed("write cancelled"))
+        self._pending.clear()
+
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _fail(self, pending: _PendingWrite, error: BaseException) -> None:
+        for future in pending.futures:
+            if not future.done():
+                future.set_exception(error)
+
+    async def _execute(self, register: int, pending: _PendingWrite) -> None:
+        self.logger.debug("applying debounced write for register %d: %s", register, pending.values)
+        try:
+            await pending.apply(**pending.values)
+        except asyncio.CancelledError:
+            self._fail(pending, CommandFailed("write cancelled"))
+            raise
+        except Exception as e:
+            self._fail(pending, e)
+            return
+
+        for future in pending.futures:
+            if not future.done():
+                future.set_result(None)
@@ -0,0 +1,116 @@
+import struct
+
+from enum import Enum
+from operator import attrgetter
+from typing import Callable, Iterator, TypeVar
+
+from .models import DeviceMode, DeviceType, RampStatus, Register
+from .state import ACIDeviceState
+
+E = TypeVar("E", bound=Enum)
+
+# Status Notification (18 Bytes) - Flags, Temperature, Ramp Status, Fan Speed & Mode
+STATUS_LAYOUT = struct.Struct(">6xBxH6xBB")
+
+# Advertisement (27 Bytes) - Device ID, Device Type, Temperature, Fan Speed
+ADVERTISEMENT_LAYOUT = struct.Struct(">6x5sxBxH2xB8x")
+
+# Register Values
+U8_LAYOUT = struct.Struct(">B")
+U32_LAYOUT = struct.Struct(">I")
+AUTO_LAYOUT = struct.Struct(">BxBxB")  # On Flags, High Temp, Low Temp
+CYCLE_LAYOUT = struct.Struct(">II")  # On Time, Off Time
+
+
+def lookup_table(enum: type[E], default: E | None = None, size: int = 256) -> tuple[E | None, ...]:
+    """
+    Build a dense tuple indexed by raw value so decoding is a single index
+    instead of an Enum constructor call guarded by try/except.
+    """
+    table: list[E | None] = [default] * size
+    for member in enum:
+        table[member.value] = member
+    return tuple(table)
+
+
+DEVICE_TYPES = lookup_table(DeviceType)
+DEVICE_MODES = lookup_table(DeviceMode)
+STATUS_DEVICE_MODES = lookup_table(DeviceMode, DeviceMode.OFF, 16)
+RAMP_STATUSES = lookup_table(RampStatus, RampStatus.NONE, 16)
+
+
+def iter_registers(body: memoryview) -> Iterator[tuple[int, memoryview]]:
+    """
+    Walk [register, length, value...] records, yielding each register with a
+    view of its value. Raises ValueError when a record overruns the body.
+    """
+    idx, end = 0, len(body)
+    while idx < end:
+        if idx + 2 > end:
+            raise ValueError(f"truncated register header at offset {idx}")
+        register, length = body[idx], body[idx + 1]
+        idx += 2
+        if idx + length > end:
+            raise ValueError(f"truncated value for register {register}: {end - idx} < {length}")
+        yield register, body[idx:idx + length]
+        idx += length
+
+
+def _decode_mode(value: memoryview, state: ACIDeviceState) -> tuple:
+    return (DEVICE_MODES[value[0]] or state.mode,)
+
+
+def _decode_off_speed(value: memoryview, state: ACIDeviceState) -> tuple:
+    return (value[0],)
+
+
+def _decode_on_speed(value: memoryview, state: ACIDeviceState) -> tuple:
+    return (value[0],)
+
+
+def _decode_auto(value: memoryview, state: ACIDeviceState) -> tuple:
+    flags, high_temp, low_temp = AUTO_LAYOUT.unpack_from(value)
+    return bool(flags & (1 << 3)), bool(flags & (1 << 2)), high_temp, low_temp
+
+
+def _decode_timer_to_on(value: memoryview, state: ACIDeviceState) -> tuple:
+    return U32_LAYOUT.unpack_from(value)
+
+
+def _decode_timer_to_off(value: memoryview, state: ACIDeviceState) -> tuple:
+    return U32_LAYOUT.unpack_from(value)
+
+
+def _decode_cycle(value: memoryview, state: ACIDeviceState) -> tuple:
+    return CYCLE_LAYOUT.unpack_from(value)
+
+
+# Register -> (Minimum Value Length, Decoder Returning Values In REGISTER_FIELDS Order)
+REGISTER_DECODERS: dict[int, tuple[int, Callable[[memoryview, ACIDeviceState], tuple]]] = {
+    Register.MODE: (U8_LAYOUT.size, _decode_mode),
+    Register.OFF_SPEED: (U8_LAYOUT.size, _decode_off_speed),
+    Register.ON_SPEED: (U8_LAYOUT.size, _decode_on_speed),
+    Register.AUTO: (AUTO_LAYOUT.size, _decode_auto),
+    Register.TIMER_TO_ON: (U32_LAYOUT.size, _decode_timer_to_on),
+    Register.TIMER_TO_OFF: (U32_LAYOUT.size, _decode_timer_to_off),
+    Register.CYCLE: (CYCLE_LAYOUT.size, _decode_cycle),
+}
+
+# Register -> ACIDeviceState Fields
+REGISTER_FIELDS: dict[int, tuple[str, ...]] = {
+    Register.MODE: ("mode",),
+    Register.OFF_SPEED: ("fan_speed_off",),
+    Register.ON_SPEED: ("fan_speed_on",),
+    Register.AUTO: ("auto_high_temp_on", "auto_low_temp_on", "auto_high_temp", "auto_low_temp"),
+    Register.TIMER_TO_ON: ("timer_to_on_time",),
+    Register.TIMER_TO_OFF: ("timer_to_off_time",),
+    Register.CYCLE: ("cycle_on_time", "cycle_off_time"),
+}
+
+# Fields Carried By Advertisements & Status Notifications
+ADVERTISEMENT_FIELDS = ("id", "name", "model", "fan_speed", "temperature")
+STATUS_FIELDS = ("is_farenheight", "temperature", "fan_speed", "ramp_status", "mode")
+
+# Current State Values Of Those Fields
+ADVERTISEMENT_VALUES = attrgetter(*ADVERTISEMENT_FIELDS)
+STATUS_VALUES = attrgetter(*STATUS_FIELDS)
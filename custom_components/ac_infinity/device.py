@@ -1,13 +1,43 @@
+import asyncio
 import logging
 
+from contextlib import asynccontextmanager
+from dataclasses import replace
+from functools import lru_cache, partial
 from bleak.backends.device import BLEDevice
 from logging import Logger
-from typing import Callable
+from typing import Any, AsyncIterator, Callable, Iterable
 
-from .client import Client
-from .models import DeviceMode
-from .protocol import Command, Protocol
+from .arbiter import ConnectionArbiter
+from .client import Client, ConnectionPolicy
+from .models import CommandFailed, DataSource, DeviceMode, Register
+from .decoder import ADVERTISEMENT_FIELDS, ADVERTISEMENT_VALUES, REGISTER_FIELDS, STATUS_FIELDS, STATUS_VALUES
+from .frame_cache import FrameCache
+from .protocol import CMD_TYPE_READ, CMD_TYPE_WRITE, MODEL_DATA_REGISTERS, Command, CommandPool, Protocol, merge_writes
+from .scheduler import PRIORITY_INTERACTIVE
 from .state import ACIDeviceState, AutoState, CycleState
+from .utils import Buffer
+
+WRITE_COALESCE_WINDOW = 0.05
+REGISTER_CACHE_TTL = 120
+
+# Frame Cache Kinds - Model Data Is Keyed By The Registers Read
+FRAME_ADVERTISEMENT = "advertisement"
+FRAME_STATUS = "status"
+FRAME_MODEL_DATA = "model_data"
+
+
+@lru_cache(maxsize=32)
+def _register_fields(registers: tuple[int, ...]) -> tuple[str, ...]:
+    return tuple(key for register in registers for key in REGISTER_FIELDS.get(register, ()))
+
+
+class _GroupBatch:
+    __slots__ = ("changes", "future")
+
+    def __init__(self, future: asyncio.Future[None]):
+        self.changes: dict[str, Any] = {}
+        self.future = future
 
 
 class ACIBluetoothDevice:
@@ -17,14 +47,49 @@ class ACIBluetoothDevice:
             state: ACIDeviceState,
             logger: Logger | None,
             on_state_update: Callable[[], None] | None = None,
-            on_status_update: Callable[[bytes], None] | None = None
+            on_status_update: Callable[[Buffer], None] | None = None,
+            write_window: float = WRITE_COALESCE_WINDOW,
+            optimistic: bool = False,
+            register_ttl: float = REGISTER_CACHE_TTL,
+            connection_policy: ConnectionPolicy = ConnectionPolicy.IDLE_TIMEOUT,
+            connection_arbiter: ConnectionArbiter | None = None,
+            write_without_response: bool = False,
+            on_write: Callable[[], None] | None = None,
     ):
         self.logger = logger or logging.getLogger(__name__)
         self.protocol = Protocol(self.logger)
-        self.client = Client(device, self._update_from_status_data, self.logger)
+        self.client = Client(
+            device,
+            self._update_from_status_data,
+            self.logger,
+            connection_policy,
+            arbiter=connection_arbiter,
+            write_without_response=write_without_response,
+        )
         self.state = state
         self._on_state_update = on_state_update
         self._on_status_update = on_status_update
+        self._on_write = on_write
+        self._write_window = write_window
+        self._optimistic = optimistic
+        self._unverified: dict[str, Any] = {}
+        self._pending_writes: list[tuple[Command, asyncio.Future[None]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # Background Write Tasks - Strong References Until Done
+        self._tasks: set[asyncio.Task] = set()
+        self._register_ttl = register_ttl
+        self._group_locks: dict[int, asyncio.Lock] = {}
+        self._group_batches: dict[int, _GroupBatch] = {}
+        self.frame_cache = FrameCache()
+        self._read_commands = CommandPool()
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """
+        Hold one connection across a multi-step operation.
+        """
+        async with self.client.lease():
+            yield
 
     async def set_mode(self, mode: DeviceMode):
         await self._send_command_and_update(self.protocol.set_mode(mode))
@@ -51,89 +116,250 @@ class ACIBluetoothDevice:
         await self._send_command_and_update(self.protocol.set_timer_to_on(time))
 
     async def set_cycle_on_time(self, time: int):
-        cycle_state = await self._get_cycle_state()
-        if cycle_state is None:
-            return
-        cycle_state.cycle_on_time = time
-        await self._send_command_and_update(self.protocol.set_cycle(cycle_state))
+        await self.update_cycle(cycle_on_time=time)
 
     async def set_cycle_off_time(self, time: int):
-        cycle_state = await self._get_cycle_state()
-        if cycle_state is None:
-            return
-        cycle_state.cycle_off_time = time
-        await self._send_command_and_update(self.protocol.set_cycle(cycle_state))
+        await self.update_cycle(cycle_off_time=time)
+
+    async def update_cycle(self, **changes: Any):
+        await self._update_group(Register.CYCLE, changes)
 
     async def set_auto_high_temp(self, temp: float):
-        auto_state = await self._get_auto_state()
-        if auto_state is None:
-            return
-        auto_state.high_temp = temp
-        await self._send_command_and_update(self.protocol.set_auto(auto_state))
+        await self.update_auto(high_temp=temp)
 
     async def set_auto_temp(self, low_temp: float, high_temp: float):
-        auto_state = await self._get_auto_state()
-        if auto_state is None:
-            return
-        auto_state.high_temp = high_temp
-        auto_state.low_temp = low_temp
-        await self._send_command_and_update(self.protocol.set_auto(auto_state))
+        await self.update_auto(low_temp=low_temp, high_temp=high_temp)
 
     async def set_auto_low_temp(self, temp: float):
-        auto_state = await self._get_auto_state()
-        if auto_state is None:
-            return
-        auto_state.low_temp = temp
-        await self._send_command_and_update(self.protocol.set_auto(auto_state))
+        await self.update_auto(low_temp=temp)
 
     async def set_auto_low_switch(self, on: bool):
-        auto_state = await self._get_auto_state()
-        if auto_state is None:
-            return
-        auto_state.low_temp_on = on
-        await self._send_command_and_update(self.protocol.set_auto(auto_state))
+        await self.update_auto(low_temp_on=on)
 
     async def set_auto_high_switch(self, on: bool):
-        auto_state = await self._get_auto_state()
-        if auto_state is None:
+        await self.update_auto(high_temp_on=on)
+
+    async def update_auto(self, **changes: Any):
+        await self._update_group(Register.AUTO, changes)
+
+    async def _update_group(self, register: Register, changes: dict[str, Any]):
+        # Fold Changes - Concurrent Callers Share The Next Write Of The Group & Its Outcome
+        batch = self._group_batches.get(register)
+        if batch is None:
+            batch = self._group_batches[register] = _GroupBatch(asyncio.get_running_loop().create_future())
+            self._track(asyncio.create_task(self._write_group(register, batch)))
+        batch.changes.update(changes)
+        await batch.future
+
+    async def _write_group(self, register: Register, batch: _GroupBatch) -> None:
+        lock = self._group_locks.setdefault(register, asyncio.Lock())
+        try:
+            async with lock, self.transaction():
+                # Batch Closed - Later Changes Start The Next One
+                if self._group_batches.get(register) is batch:
+                    del self._group_batches[register]
+
+                group_state = await (self._get_auto_state() if register == Register.AUTO else self._get_cycle_state())
+                if group_state is None:
+                    raise CommandFailed(f"could not read register {register.name} to update")
+
+                group_state = replace(group_state, **batch.changes)
+                if isinstance(group_state, AutoState):
+                    await self._send_command_and_update(self.protocol.set_auto(group_state))
+                else:
+                    await self._send_command_and_update(self.protocol.set_cycle(group_state))
+        except asyncio.CancelledError:
+            self._resolve(batch.future, CommandFailed("write cancelled"))
+            raise
+        except Exception as e:
+            self._resolve(batch.future, e)
+        else:
+            self._resolve(batch.future)
+        finally:
+            if self._group_batches.get(register) is batch:
+                del self._group_batches[register]
+
+    def _track(self, task: asyncio.Task) -> None:
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    def _resolve(future: asyncio.Future[None], error: BaseException | None = None) -> None:
+        if future.done():
             return
-        auto_state.high_temp_on = on
-        await self._send_command_and_update(self.protocol.set_auto(auto_state))
+        if error is None:
+            future.set_result(None)
+        else:
+            future.set_exception(error)
 
     async def _get_auto_state(self) -> AutoState | None:
-        if auto_state := self.state.get_auto_state():
+        if (auto_state := self.state.get_auto_state()) and self._is_fresh(Register.AUTO):
             return auto_state
         else:
-            await self.update_model_data()
+            await self.read_registers([Register.AUTO], PRIORITY_INTERACTIVE)
         if auto_state := self.state.get_auto_state():
             return auto_state
 
     async def _get_cycle_state(self) -> CycleState | None:
-        if cycle_state := self.state.get_cycle_state():
+        if (cycle_state := self.state.get_cycle_state()) and self._is_fresh(Register.CYCLE):
             return cycle_state
         else:
-            await self.update_model_data()
+            await self.read_registers([Register.CYCLE], PRIORITY_INTERACTIVE)
         if cycle_state := self.state.get_cycle_state():
             return cycle_state
 
+    def _is_fresh(self, register: int) -> bool:
+        return self.state.is_fresh(REGISTER_FIELDS[register], self._register_ttl)
+
     async def update_model_data(self):
-        await self._send_command(self.protocol.get_model_data())
+        await self.read_registers(MODEL_DATA_REGISTERS)
+
+    async def read_registers(self, registers: Iterable[int], priority: int | None = None):
+        # Polls & Read-Backs Repeat - Reuse Their Compiled Frames
+        key = (tuple(registers), priority)
+        cmd = self._read_commands.take(key, partial(self._build_read, key))
+        try:
+            await self._send_command(cmd)
+        finally:
+            self._read_commands.give(key, cmd)
+
+    def _build_read(self, key: tuple[tuple[int, ...], int | None]) -> Command:
+        registers, priority = key
+        callback = partial(self._process_model_data, (FRAME_MODEL_DATA, registers))
+        return self.protocol.read_registers(registers, priority, callback)
+
+    def _process_model_data(self, kind: tuple[str, tuple[int, ...]], data: Buffer, state: ACIDeviceState) -> bool:
+        # Body Only - Sequence & Header CRC Differ Per Response
+        body = memoryview(data)[8:]
+        fields = _register_fields(kind[1])
+        if self.frame_cache.is_duplicate(kind, body, state.values(fields)):
+            state.touch(DataSource.MODEL_READ, fields)
+            return False
+        if updated := self.protocol.process_model_data(data, state):
+            self.frame_cache.store(kind, body, state.values(fields))
+        return updated
 
     async def _send_command_and_update(self, cmd: Command):
-        await self._send_command(cmd)
-        await self.update_model_data()
+        # Queue Write - Flushed With Others Issued Within The Window
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        self._pending_writes.append((cmd, future))
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._write_window, self._flush_writes)
+        await future
+
+    def _flush_writes(self) -> None:
+        self._flush_handle = None
+        batch, self._pending_writes = self._pending_writes, []
+        self._track(asyncio.create_task(self._execute_writes(batch)))
+
+    async def close(self) -> None:
+        """
+        Cancel queued and in flight writes, failing their callers, then
+        disconnect and release the connection slot.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending_writes = self._pending_writes, []
+        self._fail_writes(batch, CommandFailed("device closed"))
+
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.client.close()
+
+    def _fail_writes(self, batch: list[tuple[Command, asyncio.Future[None]]], error: BaseException) -> None:
+        for _, future in batch:
+            self._resolve(future, error)
 
-    async def _send_command(self, cmd: Command):
-        if resp := await self.client.send(cmd):
-            if cmd.handle_response(resp, self.state) and self._on_state_update:
+    async def _execute_writes(self, batch: list[tuple[Command, asyncio.Future[None]]]) -> None:
+        cmd = merge_writes(c for c, _ in batch)
+        if len(batch) > 1:
+            self.logger.debug("coalesced %d writes for registers %s", len(batch), cmd.registers)
+
+        try:
+            async with self.transaction():
+                # Optimistic - Apply Values On Write Response, Verify On Next Read / Status
+                if self._optimistic and cmd.values:
+                    cmd.with_callback(cmd.apply_values)
+                    try:
+                        await self._send_command(cmd)
+                    except CommandFailed:
+                        # Unanswered Writes May Still Have Landed - Resync, Then Fail Callers
+                        try:
+                            await self._read_back(cmd)
+                        except Exception as e:
+                            self.logger.warning("read-back after unanswered write failed: %s", e)
+                        raise
+                    self._unverified.update(cmd.values)
+                else:
+                    await self._send_command(cmd)
+                    await self._read_back(cmd)
+        except asyncio.CancelledError:
+            # Callers Still Waiting Must Not Hang
+            self._fail_writes(batch, CommandFailed("write cancelled"))
+            raise
+        except Exception as e:
+            self._fail_writes(batch, e)
+            return
+
+        if self._on_write:
+            self._on_write()
+        for _, future in batch:
+            if not future.done():
+                future.set_result(None)
+
+    async def _read_back(self, cmd: Command) -> None:
+        if cmd.registers:
+            await self.read_registers(cmd.registers, PRIORITY_INTERACTIVE)
+        else:
+            await self.update_model_data()
+
+    async def _send_command(self, cmd: Command) -> Buffer | None:
+        try:
+            resp = await self.client.send(cmd)
+        finally:
+            # Writes Change State Behind Cached Frames
+            if cmd.type == CMD_TYPE_WRITE:
+                self.frame_cache.invalidate()
+
+        if resp:
+            updated = cmd.handle_response(resp, self.state)
+            if updated and self._on_state_update:
                 self._on_state_update()
+            if cmd.type == CMD_TYPE_READ and self._unverified:
+                for register in cmd.registers:
+                    self._verify_values(REGISTER_FIELDS.get(register, ()))
+        return resp
+
+    def _verify_values(self, fields: Iterable[str]) -> None:
+        for key in fields:
+            if key not in self._unverified:
+                continue
+            expected = self._unverified.pop(key)
+            actual = getattr(self.state, key)
+            if actual != expected:
+                self.logger.warning("read-back corrected optimistic %s: wrote %s, device reports %s", key, expected, actual)
 
-    def _update_from_status_data(self, data: bytes) -> None:
+    def _update_from_status_data(self, data: Buffer) -> None:
         if self._on_status_update:
             self._on_status_update(data)
-        if self.protocol.process_status(data, self.state) and self._on_state_update:
-            self._on_state_update()
+        # Duplicate Only If No Other Frame Kind Changed The Shared Fields Since
+        if self.frame_cache.is_duplicate(FRAME_STATUS, data, STATUS_VALUES(self.state)):
+            self.state.touch(DataSource.STATUS, STATUS_FIELDS)
+        elif self.protocol.process_status(data, self.state):
+            self.frame_cache.store(FRAME_STATUS, data, STATUS_VALUES(self.state))
+            if self._on_state_update:
+                self._on_state_update()
+        if self._unverified:
+            self._verify_values(REGISTER_FIELDS[Register.MODE])
 
-    def _update_from_advertisement_data(self, data: bytes) -> None:
-        if self.protocol.process_advertisement(data, self.state) and self._on_state_update:
-            self._on_state_update()
+    def _update_from_advertisement_data(self, data: Buffer) -> None:
+        if self.frame_cache.is_duplicate(FRAME_ADVERTISEMENT, data, ADVERTISEMENT_VALUES(self.state)):
+            self.state.touch(DataSource.ADVERTISEMENT, ADVERTISEMENT_FIELDS)
+        elif self.protocol.process_advertisement(data, self.state):
+            self.frame_cache.store(FRAME_ADVERTISEMENT, data, ADVERTISEMENT_VALUES(self.state))
+            if self._on_state_update:
+                self._on_state_update()
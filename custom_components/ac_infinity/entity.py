@@ -1,14 +1,45 @@
-from typing import Any
+import time
+
+from functools import wraps
+from typing import Any, Awaitable, Callable
 
 from homeassistant.components.bluetooth.passive_update_coordinator import PassiveBluetoothCoordinatorEntity
-from homeassistant.core import callback
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import async_call_later
 
 from .coordinator import ACICoordinator
+from .models import CommandFailed
+from .publish import PublishGate
+
+
+def command_action(func: Callable[..., Awaitable[None]]) -> Callable[..., Awaitable[None]]:
+    """
+    Surface commands the device never acknowledged as a Home Assistant error
+    rather than letting the service call appear to succeed.
+    """
+
+    @wraps(func)
+    async def wrapper(self: "ACIEntity", *args: Any, **kwargs: Any) -> None:
+        try:
+            await func(self, *args, **kwargs)
+        except CommandFailed as e:
+            raise HomeAssistantError(f"{self.coordinator.name}: {e}") from e
+
+    return wrapper
 
 
 class ACIEntity(PassiveBluetoothCoordinatorEntity[ACICoordinator]):
+    # State Fields Rendered - None Updates On Any Change
+    _state_fields: tuple[str, ...] | None = None
+
+    # Publication Gate - Set By Entities Rate Limiting A Measured Value
+    _publish_gate: PublishGate | None = None
+    _publish_timer: CALLBACK_TYPE | None = None
+    _publish_due: float | None = None
+
     def __init__(self, coordinator: ACICoordinator) -> None:
         super().__init__(coordinator)
         self._attr_device_info = DeviceInfo(
@@ -20,11 +51,81 @@ class ACIEntity(PassiveBluetoothCoordinatorEntity[ACICoordinator]):
         )
         self._async_update_attrs()
 
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_field_listener(self._handle_coordinator_update, self._state_fields)
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        self._cancel_publish()
+        await super().async_will_remove_from_hass()
+
+    async def async_update(self) -> None:
+        """
+        Requested refresh - publish the latest value regardless of policy.
+        """
+        self._async_update_attrs()
+        self._cancel_publish()
+        if self._publish_gate is not None:
+            self._publish_gate.published(self._publish_key(), self._publish_value(), time.monotonic())
+            self._schedule_heartbeat()
+
     @callback
     def _async_update_attrs(self) -> None:
         raise NotImplementedError("Not yet implemented.")
 
+    def _publish_key(self) -> tuple:
+        """
+        Rendered state besides the gated value - changes always publish.
+        """
+        return (self.available,)
+
+    def _publish_value(self) -> float | None:
+        return None
+
     @callback
     def _handle_coordinator_update(self, *args: Any) -> None:
         self._async_update_attrs()
+        if self._publish_gate is None:
+            self.async_write_ha_state()
+            return
+
+        # Hold Back Insignificant Changes - Publish Later If Still Pending
+        now = time.monotonic()
+        delay = self._publish_gate.check(self._publish_key(), self._publish_value(), self.coordinator.publish_policy, now)
+        if delay == 0:
+            self._async_publish()
+        elif delay is not None:
+            self._schedule_publish(now, delay)
+
+    def _schedule_publish(self, now: float, delay: float) -> None:
+        if self._publish_due is None or now + delay < self._publish_due:
+            self._cancel_publish()
+            self._publish_due = now + delay
+            self._publish_timer = async_call_later(self.hass, delay, self._async_publish_pending)
+
+    def _schedule_heartbeat(self) -> None:
+        # Republish Unchanged Values Even Without Further Updates
+        if heartbeat := self.coordinator.publish_policy.heartbeat:
+            self._schedule_publish(time.monotonic(), heartbeat)
+
+    @callback
+    def _async_publish(self) -> None:
+        self._cancel_publish()
+        self._publish_gate.published(self._publish_key(), self._publish_value(), time.monotonic())
         self.async_write_ha_state()
+        self._schedule_heartbeat()
+
+    @callback
+    def _async_publish_pending(self, _now: Any) -> None:
+        self._publish_timer = None
+        self._publish_due = None
+        self._async_update_attrs()
+        self._async_publish()
+
+    def _cancel_publish(self) -> None:
+        if self._publish_timer is not None:
+            self._publish_timer()
+        self._publish_timer = None
+        self._publish_due = None
@@ -10,7 +10,7 @@ from homeassistant.util.scaling import int_states_in_range
 
 from .consts import DOMAIN
 from .coordinator import ACICoordinator
-from .entity import ACIEntity
+from .entity import ACIEntity, command_action
 from .models import DeviceMode
 
 SPEED_RANGE = (1, 10)
@@ -33,6 +33,7 @@ class ACIFan(ACIEntity, FanEntity):
         FanEntityFeature.TURN_ON |
         FanEntityFeature.TURN_OFF
     )
+    _state_fields = ("mode", "fan_speed")
 
     def __init__(self, coordinator: ACICoordinator):
         super().__init__(coordinator)
@@ -43,6 +44,7 @@ class ACIFan(ACIEntity, FanEntity):
     def available(self) -> bool:  # type: ignore
         return self.coordinator.available
 
+    @command_action
     async def async_set_percentage(self, percentage: int) -> None:
         speed = math.ceil(percentage_to_ranged_value(SPEED_RANGE, percentage))
         if speed == 0 and self.coordinator.state.mode == DeviceMode.ON:
@@ -52,15 +54,18 @@ class ACIFan(ACIEntity, FanEntity):
         else:
             await self.coordinator.bt.set_on_speed(speed)
 
+    @command_action
     async def async_turn_on(self, percentage: int | None = None, preset_mode: str | None = None, **kwargs: Any) -> None:
         speed = None
         if percentage is not None:
             speed = math.ceil(percentage_to_ranged_value(SPEED_RANGE, percentage))
         await self.coordinator.bt.turn_on(speed)
 
+    @command_action
     async def async_turn_off(self, **kwargs: Any) -> None:
         await self.coordinator.bt.turn_off()
 
+    @command_action
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         await self.coordinator.bt.set_mode(DeviceMode.from_string(preset_mode))
 
@@ -0,0 +1,55 @@
+from dataclasses import dataclass
+from typing import Any, Hashable
+
+from .utils import Buffer
+
+
+@dataclass
+class FrameCounts:
+    seen: int = 0
+    dropped: int = 0
+
+    @property
+    def drop_rate(self) -> float | None:
+        return self.dropped / self.seen if self.seen else None
+
+
+class FrameCache:
+    """
+    Last successfully parsed raw frame per frame kind, with the state values
+    it decoded to. Frames identical to the previous one of their kind carry
+    nothing new and are dropped before parsing - unless frames of another
+    kind have since changed those values, which the values check catches.
+    """
+
+    def __init__(self):
+        self._frames: dict[Hashable, tuple[bytes, Any]] = {}
+        self.counts: dict[Hashable, FrameCounts] = {}
+
+    def is_duplicate(self, kind: Hashable, data: Buffer, values: Any = None) -> bool:
+        counts = self.counts.get(kind)
+        if counts is None:
+            counts = self.counts[kind] = FrameCounts()
+        counts.seen += 1
+
+        if (cached := self._frames.get(kind)) is not None and cached[0] == data and cached[1] == values:
+            counts.dropped += 1
+            return True
+        return False
+
+    def store(self, kind: Hashable, data: Buffer, values: Any = None) -> None:
+        """
+        Remember a frame once it parsed successfully, with the current state
+        values of the fields it carries.
+        """
+        self._frames[kind] = (bytes(data), values)
+
+    def drop_rate(self, kind: Hashable) -> float | None:
+        counts = self.counts.get(kind)
+        return counts.drop_rate if counts else None
+
+    def invalidate(self, *kinds: Hashable) -> None:
+        if not kinds:
+            self._frames.clear()
+        for kind in kinds:
+            self._frames.pop(kind, None)
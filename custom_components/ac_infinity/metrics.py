@@ -0,0 +1,87 @@
+import bisect
+import time
+
+from collections import deque
+
+# Histogram Bucket Upper Bounds (Seconds)
+LATENCY_BUCKETS = (0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5, 10, 30)
+RATE_WINDOW = 60
+
+
+class Histogram:
+    """
+    Fixed bucket histogram. Recording is a bisect and an increment; quantiles
+    are interpolated within the bucket they fall in.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.last: float | None = None
+        self.max: float | None = None
+
+    def record(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.last = value
+        self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def mean(self) -> float | None:
+        return self.total / self.count if self.count else None
+
+    def quantile(self, q: float) -> float | None:
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for idx, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.buckets[idx - 1] if idx > 0 else 0
+                upper = self.buckets[idx] if idx < len(self.buckets) else self.max
+                return min(lower + (upper - lower) * (rank - seen) / count, self.max)
+            seen += count
+        return self.max
+
+
+class RateMeter:
+    """
+    Event rate over a sliding window, in events per minute.
+    """
+
+    def __init__(self, window: float = RATE_WINDOW):
+        self.window = window
+        self.count = 0
+        self._events: deque[float] = deque()
+
+    def record(self) -> None:
+        now = time.monotonic()
+        self.count += 1
+        self._events.append(now)
+        self._prune(now)
+
+    @property
+    def per_minute(self) -> float:
+        self._prune(time.monotonic())
+        return len(self._events) * 60 / self.window
+
+    def _prune(self, now: float) -> None:
+        while self._events and now - self._events[0] > self.window:
+            self._events.popleft()
+
+
+class LinkMetrics:
+    """
+    Per device link health, recorded by the client.
+    """
+
+    def __init__(self):
+        self.connect_time = Histogram()
+        self.rtt = Histogram()
+        self.timeouts = 0
+        self.unknown_sequence = 0
+        self.fast_write_fallbacks = 0
+        self.notifications = RateMeter()
@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class DeviceNotSupported(Exception):
@@ -6,6 +6,11 @@ class DeviceNotSupported(Exception):
     pass
 
 
+class CommandFailed(Exception):
+    """Raised when a command could not be delivered or was not answered"""
+    pass
+
+
 class DeviceType(Enum):
     AIRTAP = (6, "D", "AirTap")
 
@@ -50,7 +55,24 @@ class DeviceMode(Enum):
         raise ValueError(f"No DeviceMode with id_string '{id_string}'")
 
 
+class DataSource(Enum):
+    ADVERTISEMENT = "advertisement"
+    STATUS = "status"
+    MODEL_READ = "model_read"
+    WRITE = "write"
+
+
 class RampStatus(Enum):
     UP = 8
     DOWN = 4
     NONE = 0
+
+
+class Register(IntEnum):
+    MODE = 16
+    OFF_SPEED = 17
+    ON_SPEED = 18
+    AUTO = 19
+    TIMER_TO_ON = 20
+    TIMER_TO_OFF = 21
+    CYCLE = 22
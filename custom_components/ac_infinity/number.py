@@ -6,7 +6,8 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .consts import DOMAIN
 from .coordinator import ACICoordinator
-from .entity import ACIEntity
+from .entity import ACIEntity, command_action
+from .models import Register
 
 
 async def async_setup_entry(
@@ -34,14 +35,16 @@ class AutoHighTemperature(ACIEntity, NumberEntity):
     _attr_mode = NumberMode.BOX
     _attr_native_min_value = 0
     _attr_native_max_value = 50
+    _state_fields = ("auto_high_temp",)
 
     def __init__(self, coordinator: ACICoordinator):
         super().__init__(coordinator)
         self._attr_name = "Auto High Temp"
         self._attr_unique_id = f"{self.coordinator.state.id}_auto_high_temp"
 
+    @command_action
     async def async_set_native_value(self, value: float) -> None:
-        await self.coordinator.bt.set_auto_high_temp(value)
+        await self.coordinator.debouncer.submit(Register.AUTO, {"high_temp": value}, self.coordinator.bt.update_auto)
 
     @property
     def available(self) -> bool:  # type: ignore
@@ -59,14 +62,16 @@ class AutoLowTemperature(ACIEntity, NumberEntity):
     _attr_mode = NumberMode.BOX
     _attr_native_min_value = 0
     _attr_native_max_value = 50
+    _state_fields = ("auto_low_temp",)
 
     def __init__(self, coordinator: ACICoordinator):
         super().__init__(coordinator)
         self._attr_name = "Auto Low Temp"
         self._attr_unique_id = f"{self.coordinator.state.id}_auto_low_temp"
 
+    @command_action
     async def async_set_native_value(self, value: float) -> None:
-        await self.coordinator.bt.set_auto_low_temp(value)
+        await self.coordinator.debouncer.submit(Register.AUTO, {"low_temp": value}, self.coordinator.bt.update_auto)
 
     @property
     def available(self) -> bool:  # type: ignore
@@ -83,14 +88,16 @@ class CycleOffTime(ACIEntity, NumberEntity):
     _attr_entity_category = EntityCategory.CONFIG
     _attr_mode = NumberMode.BOX
     _attr_native_min_value = 0
+    _state_fields = ("cycle_off_time",)
 
     def __init__(self, coordinator: ACICoordinator):
         super().__init__(coordinator)
         self._attr_name = "Cycle Off Time"
         self._attr_unique_id = f"{self.coordinator.state.id}_cycle_off_time"
 
+    @command_action
     async def async_set_native_value(self, value: float) -> None:
-        await self.coordinator.bt.set_cycle_off_time(int(value * 60))
+        await self.coordinator.debouncer.submit(Register.CYCLE, {"cycle_off_time": int(value * 60)}, self.coordinator.bt.update_cycle)
 
     @property
     def available(self) -> bool:  # type: ignore
@@ -108,14 +115,16 @@ class CycleOnTime(ACIEntity, NumberEntity):
     _attr_entity_category = EntityCategory.CONFIG
     _attr_mode = NumberMode.BOX
     _attr_native_min_value = 0
+    _state_fields = ("cycle_on_time",)
 
     def __init__(self, coordinator: ACICoordinator):
         super().__init__(coordinator)
         self._attr_name = "Cycle On Time"
         self._attr_unique_id = f"{self.coordinator.state.id}_cycle_on_time"
 
+    @command_action
     async def async_set_native_value(self, value: float) -> None:
-        await self.coordinator.bt.set_cycle_on_time(int(value * 60))
+        await self.coordinator.debouncer.submit(Register.CYCLE, {"cycle_on_time": int(value * 60)}, self.coordinator.bt.update_cycle)
 
     @property
     def available(self) -> bool:  # type: ignore
@@ -132,14 +141,16 @@ class OnSpeed(ACIEntity, NumberEntity):
     _attr_native_min_value = 0
     _attr_native_max_value = 10
     _attr_native_step = 1
+    _state_fields = ("fan_speed_on",)
 
     def __init__(self, coordinator: ACICoordinator):
         super().__init__(coordinator)
         self._attr_name = "On Fan Speed"
         self._attr_unique_id = f"{self.coordinator.state.id}_on_fan_speed"
 
+    @command_action
     async def async_set_native_value(self, value: float) -> None:
-        await self.coordinator.bt.set_on_speed(int(value))
+        await self.coordinator.debouncer.submit(Register.ON_SPEED, {"speed": int(value)}, self.coordinator.bt.set_on_speed)
 
     @property
     def available(self) -> bool:  # type: ignore
@@ -155,14 +166,16 @@ class OffSpeed(ACIEntity, NumberEntity):
     _attr_native_min_value = 0
     _attr_native_max_value = 10
     _attr_native_step = 1
+    _state_fields = ("fan_speed_off",)
 
     def __init__(self, coordinator: ACICoordinator):
         super().__init__(coordinator)
         self._attr_name = "Off Fan Speed"
         self._attr_unique_id = f"{self.coordinator.state.id}_off_fan_speed"
 
+    @command_action
     async def async_set_native_value(self, value: float) -> None:
-        await self.coordinator.bt.set_off_speed(int(value))
+        await self.coordinator.debouncer.submit(Register.OFF_SPEED, {"speed": int(value)}, self.coordinator.bt.set_off_speed)
 
     @property
     def available(self) -> bool:  # type: ignore
@@ -179,14 +192,16 @@ class TimerToOnTime(ACIEntity, NumberEntity):
     _attr_entity_category = EntityCategory.CONFIG
     _attr_mode = NumberMode.BOX
     _attr_native_min_value = 0
+    _state_fields = ("timer_to_on_time",)
 
     def __init__(self, coordinator: ACICoordinator):
         super().__init__(coordinator)
         self._attr_name = "Timer to On"
         self._attr_unique_id = f"{self.coordinator.state.id}_timer_to_on"
 
+    @command_action
     async def async_set_native_value(self, value: float) -> None:
-        await self.coordinator.bt.set_timer_to_on(int(value * 60))
+        await self.coordinator.debouncer.submit(Register.TIMER_TO_ON, {"time": int(value * 60)}, self.coordinator.bt.set_timer_to_on)
 
     @property
     def available(self) -> bool:  # type: ignore
@@ -204,14 +219,16 @@ class TimerToOffTime(ACIEntity, NumberEntity):
     _attr_entity_category = EntityCategory.CONFIG
     _attr_mode = NumberMode.BOX
     _attr_native_min_value = 0
+    _state_fields = ("timer_to_off_time",)
 
     def __init__(self, coordinator: ACICoordinator):
         super().__init__(coordinator)
         self._attr_name = "Timer to Off"
         self._attr_unique_id = f"{self.coordinator.state.id}_timer_to_off"
 
+    @command_action
     async def async_set_native_value(self, value: float) -> None:
-        await self.coordinator.bt.set_timer_to_off(int(value * 60))
+        await self.coordinator.debouncer.submit(Register.TIMER_TO_OFF, {"time": int(value * 60)}, self.coordinator.bt.set_timer_to_off)
 
     @property
     def available(self) -> bool:  # type: ignore
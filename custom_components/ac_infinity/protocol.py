@@ -2,82 +2,159 @@ import logging
 import struct
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from logging import Logger
-from typing import Callable
+from typing import Any, Callable, Hashable, Iterable, Iterator
 
-from .models import DeviceMode, DeviceType, RampStatus
+from .crc import crc16
+from .decoder import (ADVERTISEMENT_FIELDS, ADVERTISEMENT_LAYOUT, DEVICE_TYPES, RAMP_STATUSES, REGISTER_DECODERS,
+                      REGISTER_FIELDS, STATUS_DEVICE_MODES, STATUS_FIELDS, STATUS_LAYOUT, iter_registers)
+from .models import DataSource, DeviceMode, Register
+from .scheduler import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE
 from .state import ACIDeviceState, AutoState, CycleState
-from .utils import format_as_hex
+from .utils import Buffer, format_as_hex
 
 
 PACKET_HEAD = bytes([165, 0])
+FRAME_HEADER_SIZE = 8
+FRAME_OVERHEAD = 12
+MAX_FRAME_SIZE = 512
 CMD_TYPE_READ = 1
 CMD_TYPE_WRITE = 3
+MODEL_DATA_REGISTERS = [16, 17, 18, 19, 20, 21, 22, 23]
 
 
-@dataclass
+@dataclass(slots=True)
 class Command:
     type: int
     command: list[int]
+    registers: list[int] = field(default_factory=list)
+    values: dict[str, Any] = field(default_factory=dict)
+    idempotent: bool = True
+    priority: int | None = None
     _callbacks: list[
-        Callable[[bytes, ACIDeviceState], bool]
+        Callable[[Buffer, ACIDeviceState], bool]
     ] = field(default_factory=list, init=False)
+    _frame: bytearray | None = field(default=None, init=False, repr=False)
 
-    def compile(self, seq: int) -> bytes:
-        return build_command(bytes(self.command), self.type, seq)
+    def compile(self, seq: int) -> bytearray:
+        # Frame Buffer Built Once - Only Sequence & Header CRC Change Per Send
+        if self._frame is None:
+            self._frame = bytearray(frame_template(self.type, tuple(self.command)))
+        patch_sequence(self._frame, seq)
+        return self._frame
+
+    def get_priority(self) -> int:
+        """
+        Explicit priority, otherwise writes are interactive and reads background.
+        """
+        if self.priority is not None:
+            return self.priority
+        return PRIORITY_INTERACTIVE if self.type == CMD_TYPE_WRITE else PRIORITY_BACKGROUND
 
     def add(self, cmd: "Command"):
+        self._frame = None
         self.command.extend(cmd.command)
+        self.registers.extend(r for r in cmd.registers if r not in self.registers)
+        self.values.update(cmd.values)
         self._callbacks.extend(cmd._callbacks)
 
-    def with_callback(self, callback: Callable[[bytes, ACIDeviceState], bool]) -> "Command":
+    def with_callback(self, callback: Callable[[Buffer, ACIDeviceState], bool]) -> "Command":
         self._callbacks.append(callback)
         return self
 
     def has_callbacks(self) -> bool:
         return len(self._callbacks) > 0
 
-    def handle_response(self, data: bytes, state: ACIDeviceState) -> bool:
+    def handle_response(self, data: Buffer, state: ACIDeviceState) -> bool:
         did_update = False
         for cb in self._callbacks:
             did_update |= cb(data, state)
         return did_update
 
+    def apply_values(self, _: Buffer, state: ACIDeviceState) -> bool:
+        """
+        Response callback that applies the written values to state.
+        """
+        state.update(DataSource.WRITE, tuple(self.values), tuple(self.values.values()))
+        return len(self.values) > 0
+
+
+class CommandPool:
+    """
+    Commands kept compiled between sends, keyed by what they read. A command
+    is taken out while in flight so concurrent identical sends build their
+    own and never patch a shared frame buffer.
+    """
+
+    def __init__(self):
+        self._idle: dict[Hashable, Command] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def take(self, key: Hashable, build: Callable[[], Command]) -> Command:
+        cmd = self._idle.pop(key, None)
+        if cmd is None:
+            self.misses += 1
+            return build()
+        self.hits += 1
+        return cmd
+
+    def give(self, key: Hashable, cmd: Command) -> None:
+        self._idle[key] = cmd
+
 
 class Protocol:
     def __init__(self, logger: Logger | None = None):
         self.logger = logger or logging.getLogger(__name__)
 
     def set_mode(self, mode: DeviceMode) -> Command:
-        return Command(CMD_TYPE_WRITE, [16, 1, mode.value])
+        return Command(CMD_TYPE_WRITE, [Register.MODE, 1, mode.value], [Register.MODE], {"mode": mode})
 
     def set_off_speed(self, speed: int) -> Command:
-        return Command(CMD_TYPE_WRITE, [17, 1, speed])
+        return Command(CMD_TYPE_WRITE, [Register.OFF_SPEED, 1, speed], [Register.OFF_SPEED], {"fan_speed_off": speed})
 
     def set_on_speed(self, speed: int) -> Command:
-        return Command(CMD_TYPE_WRITE, [18, 1, speed])
+        return Command(CMD_TYPE_WRITE, [Register.ON_SPEED, 1, speed], [Register.ON_SPEED], {"fan_speed_on": speed})
 
     def set_auto(self, state: AutoState) -> Command:
         auto_on_state = (state.low_temp_on << 2) | (state.high_temp_on << 3)
-        return Command(CMD_TYPE_WRITE, [19, 7, auto_on_state, to_f(state.high_temp), round(state.high_temp), to_f(state.low_temp), round(state.low_temp)])
+        return Command(CMD_TYPE_WRITE, [Register.AUTO, 7, auto_on_state, to_f(state.high_temp), round(state.high_temp), to_f(state.low_temp), round(state.low_temp)], [Register.AUTO], {
+            "auto_high_temp_on": state.high_temp_on,
+            "auto_low_temp_on": state.low_temp_on,
+            "auto_high_temp": round(state.high_temp),
+            "auto_low_temp": round(state.low_temp),
+        })
 
     def set_timer_to_on(self, timer_on: int):
         timer_on_bytes = list(struct.pack('>I', timer_on))
-        return Command(CMD_TYPE_WRITE, [20, 4, *timer_on_bytes])
+        return Command(CMD_TYPE_WRITE, [Register.TIMER_TO_ON, 4, *timer_on_bytes], [Register.TIMER_TO_ON], {"timer_to_on_time": timer_on})
 
     def set_timer_to_off(self, timer_off: int):
         timer_off_bytes = list(struct.pack('>I', timer_off))
-        return Command(CMD_TYPE_WRITE, [21, 4, *timer_off_bytes])
+        return Command(CMD_TYPE_WRITE, [Register.TIMER_TO_OFF, 4, *timer_off_bytes], [Register.TIMER_TO_OFF], {"timer_to_off_time": timer_off})
 
     def set_cycle(self, state: CycleState) -> Command:
         cycle_on_bytes = list(struct.pack('>I', state.cycle_on_time))
         cycle_off_bytes = list(struct.pack('>I', state.cycle_off_time))
-        return Command(CMD_TYPE_WRITE, [22, 8, *cycle_on_bytes, *cycle_off_bytes])
+        return Command(CMD_TYPE_WRITE, [Register.CYCLE, 8, *cycle_on_bytes, *cycle_off_bytes], [Register.CYCLE], {
+            "cycle_on_time": state.cycle_on_time,
+            "cycle_off_time": state.cycle_off_time,
+        })
+
+    def read_registers(
+        self,
+        registers: Iterable[int],
+        priority: int | None = None,
+        callback: Callable[[Buffer, ACIDeviceState], bool] | None = None,
+    ) -> Command:
+        registers = list(registers)
+        return Command(CMD_TYPE_READ, registers, registers.copy(), priority=priority).with_callback(callback or self.process_model_data)
 
     def get_model_data(self):
-        return Command(CMD_TYPE_READ, [16, 17, 18, 19, 20, 21, 22, 23]).with_callback(self.process_model_data)
+        return self.read_registers(MODEL_DATA_REGISTERS)
 
-    def process_model_data(self, data: bytes, state: ACIDeviceState) -> bool:
+    def process_model_data(self, data: Buffer, state: ACIDeviceState) -> bool:
         """
         IDX: 0  1  2  3  4  5  6  7  8  9  10 11 12 13 14 15 16 17 18 19 20 21 22 23 24 25 26 27 28 29 30 31 32 33 34 35 36 37 38 39 40 41 42 43 44 45 46 47 48 49 50 51 52 53
         HEX: A5 13 00 2A 00 03 37 D5 00 01 10 01 01 11 01 02 12 01 08 13 07 00 09 74 86 0C 79 8C 14 04 00 00 01 2C 15 04 00 00 01 2C 16 08 00 00 01 2C 00 00 01 2C 17 00 C7 6D
@@ -88,33 +165,37 @@ class Protocol:
                 │4 = timer to on; 5 = timer to off│   ┌────────┬───┘ │L (Bit 2)│  ├─────────┐
                 │        6 = cycle on or off      │   │Speed On│     └─────────┘  │Auto High│
                 └─────────────────────────────────┘   └────────┘                  └─────────┘
+
+        The body is a sequence of [register, length, value...] records. Only the
+        registers present are decoded, so partial reads update partial state.
         """
-        if len(data) != 54:
+        if len(data) < FRAME_OVERHEAD:
             self.logger.warning("invalid data length for model data: %s", len(data))
             return False
 
-        # Device Mode (Byte 12)
+        # Walk [Register, Length, Value...] Records (Byte 10 to CRC)
+        decoded = []
         try:
-            state.mode = DeviceMode(data[12])
-        except:
-            pass
+            for register, value in iter_registers(memoryview(data)[10:-2]):
+                entry = REGISTER_DECODERS.get(register)
+                if entry is None:
+                    continue
+                size, decode = entry
+                if len(value) < size:
+                    self.logger.warning("invalid value length for register %d: %d", register, len(value))
+                    continue
+                state.update(DataSource.MODEL_READ, REGISTER_FIELDS[register], decode(value, state))
+                decoded.append(register)
+        except ValueError as e:
+            self.logger.warning("invalid model data: %s", e)
+
+        if not decoded:
+            return False
 
-        # Update State
-        state.fan_speed_off = data[15]
-        state.fan_speed_on = data[18]
-        state.auto_high_temp_on = bool(data[21] & (1 << 3))
-        state.auto_low_temp_on = bool(data[21] & (1 << 2))
-        state.auto_high_temp = data[23]
-        state.auto_low_temp = data[25]
-        state.timer_to_on_time = int.from_bytes(data[31:34])
-        state.timer_to_off_time = int.from_bytes(data[37:40])
-        state.cycle_on_time = int.from_bytes(data[43:46])
-        state.cycle_off_time = int.from_bytes(data[47:50])
-
-        self.logger.debug("updated state via model info")
+        self.logger.debug("updated state via model info: registers %s", decoded)
         return True
 
-    def process_advertisement(self, data: bytes, state: ACIDeviceState) -> bool:
+    def process_advertisement(self, data: Buffer, state: ACIDeviceState) -> bool:
         """
         IDX: 0  1  2  3  4  5  6  7  8  9  10 11 12 13 14 15 16 17 18 19 20 21 22 23 24 25 26
         HEX: A4 C1 38 5F 42 9B 53 34 30 42 4D 03 06 00 05 CD 00 00 04 00 00 00 00 00 00 00 00
@@ -124,38 +205,33 @@ class Protocol:
                  │     (ASCII)     │ └───────────┘ │05CD = 14.85°C│ │ (0 - A) │
                  └─────────────────┘               └──────────────┘ └─────────┘
         """
-        if len(data) != 27:
+        if len(data) != ADVERTISEMENT_LAYOUT.size:
             self.logger.warning("invalid data length for advertisement data: %s", len(data))
             return False
 
+        raw_id, raw_type, temp_raw, speed_raw = ADVERTISEMENT_LAYOUT.unpack_from(data)
+
         # Device Type (Byte 12)
-        try:
-            device = DeviceType(data[12])
-        except ValueError:
-            self.logger.warning("device not supported: %d", data[12])
+        device = DEVICE_TYPES[raw_type]
+        if device is None:
+            self.logger.warning("device not supported: %d", raw_type)
             return False
 
-        device_id = "{}-{}".format(device.prefix, data[6:11].decode('ascii'))
-        device_name = "{} ({})".format(device, device_id)
-
-        # Temperature (Bytes 14-15, Big Endian)
-        temp_raw = int.from_bytes(data[14:16], 'big')
-        temperature = temp_raw / 100.0  # 05CD = 1485 = 14.85°C
-
-        # Fan Speed (Byte 18 Lower Nibble)
-        fan_speed = data[18] & 0x0F
-
         # Update State
-        state.id = device_id
-        state.name = device_name
-        state.model = device.model
-        state.fan_speed = fan_speed
-        state.temperature = temperature
-
-        self.logger.debug("updated state via advertisement: %s" % format_as_hex(data))
+        device_id = f"{device.prefix}-{raw_id.decode('ascii')}"
+        state.update(DataSource.ADVERTISEMENT, ADVERTISEMENT_FIELDS, (
+            device_id,
+            f"{device} ({device_id})",
+            device.model,
+            speed_raw & 0x0F,  # Byte 18 Lower Nibble
+            temp_raw / 100.0,  # 05CD = 1485 = 14.85°C
+        ))
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("updated state via advertisement: %s", format_as_hex(data))
         return True
 
-    def process_status(self, data: bytes, state: ACIDeviceState) -> bool:
+    def process_status(self, data: Buffer, state: ACIDeviceState) -> bool:
         """
         IDX: 0  1  2  3  4  5  6  7  8  9  10 11 12 13 14 15 16 17
         HEX: 1E FF 02 09 03 0C 00 00 07 E4 00 00 00 00 27 10 00 32
@@ -168,58 +244,150 @@ class Protocol:
                                      │07E4 = 20.20°C│ │ (0 - A) ││        6 = cycle on or off      │
                                      └──────────────┘ └─────────┘└─────────────────────────────────┘
         """
-        if len(data) != 18:
+        if len(data) != STATUS_LAYOUT.size:
             self.logger.warning("invalid data length for status data: %s", len(data))
             return False
 
-        # Get Farenheight
-        state.is_farenheight = not bool(data[6] & (1 << 7))
-
-        # Temperature (Bytes 8-9, Big Endian)
-        temp_raw = int.from_bytes(data[8:10], 'big')
-        state.temperature = temp_raw / 100.0  # 07E4 = 2020 = 20.20°C
-
-        # Fan Speed (Byte 14 Upper Nibble)
-        state.fan_speed = data[17] >> 4
+        flags, temp_raw, ramp_raw, speed_mode = STATUS_LAYOUT.unpack_from(data)
+        state.update(DataSource.STATUS, STATUS_FIELDS, (
+            not flags & (1 << 7),  # Is Farenheight (Byte 6 Bit 7 Clear)
+            temp_raw / 100.0,  # Temperature (Bytes 8-9, Big Endian) - 07E4 = 2020 = 20.20°C
+            speed_mode >> 4,  # Fan Speed (Byte 17 Upper Nibble)
+            RAMP_STATUSES[ramp_raw >> 4],  # Ramp Status (Byte 16 Upper Nibble)
+            STATUS_DEVICE_MODES[speed_mode & 0x0F],  # Device Mode (Byte 17 Lower Nibble)
+        ))
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("updated state via status: %s", format_as_hex(data))
+        return True
 
-        # Ramp Status (Byte 16 Upper Nibble)
-        try:
-            state.ramp_status = RampStatus(data[16] >> 4)
-        except ValueError:
-            state.ramp_status = RampStatus.NONE
 
-        # Device Mode (Byte 17 Lower Nibble)
-        try:
-            state.mode = DeviceMode(data[17] & 0x0F)
-        except ValueError:
-            state.mode = DeviceMode.OFF
+def merge_writes(commands: Iterable[Command]) -> Command:
+    """
+    Merge write commands into a single command. Commands writing the same
+    registers are superseded by the latest one. The auto register is placed
+    last as its length field overstates the value written.
+    """
+    latest: dict[tuple[int, ...], Command] = {}
+    for cmd in commands:
+        key = tuple(cmd.registers)
+        latest.pop(key, None)
+        latest[key] = cmd
 
-        self.logger.debug("updated state via status: %s" % format_as_hex(data))
-        return True
+    merged = Command(CMD_TYPE_WRITE, [])
+    for cmd in sorted(latest.values(), key=lambda c: Register.AUTO in c.registers):
+        merged.add(cmd)
+    return merged
 
 
 def build_command(payload: bytes, command_type: int, seq: int):
-    d = bytearray(len(payload) + 12)
+    size = len(payload)
+    d = bytearray(size + FRAME_OVERHEAD)
+    view = memoryview(d)
     d[:len(PACKET_HEAD)] = PACKET_HEAD
-    add_int16(d, 2, len(payload))
+    add_int16(d, 2, size)
     add_int16(d, 4, seq)
-    add_int16(d, 6, crc16(d, 0, 6))
+    add_int16(d, 6, crc16(view[:6]))
     d[8] = 0
     d[9] = command_type
-    d[10:10+len(payload)] = payload
-    add_int16(d, len(payload) + 10, crc16(d, 8, len(payload) + 2))
-    seq += 1
+    d[10:10+size] = payload
+    add_int16(d, size + 10, crc16(view[8:size + 10]))
     return bytes(d)
 
 
-def crc16(d, i, n):
-    b = 0xffff
-    for k in range(i, i + n):
-        b2 = (((b << 8) | (b >> 8)) & 0xffff) ^ (d[k] & 0xff)
-        b3 = b2 ^ ((b2 & 0xff) >> 4)
-        b4 = b3 ^ ((b3 << 12) & 0xffff)
-        b = b4 ^ (((b4 & 0xff) << 5) & 0xffff)
-    return b
+@lru_cache(maxsize=64)
+def frame_template(command_type: int, payload: tuple[int, ...]) -> bytes:
+    """
+    Encoded frame for a command shape with sequence 0. The body CRC does not
+    depend on the sequence, so only the header needs patching per send.
+    """
+    return build_command(bytes(payload), command_type, 0)
+
+
+def patch_sequence(frame: bytearray, seq: int):
+    add_int16(frame, 4, seq)
+    add_int16(frame, 6, crc16(memoryview(frame)[:6]))
+
+
+def validate_frame(data: Buffer) -> bool:
+    """
+    Verify the length and both CRC fields of an A5 framed packet.
+
+    IDX: 0  1  2  3  4  5  6  7  8  ... N-3 N-2 N-1
+    HEX: A5 13 00 2A 00 03 37 D5 00 ... 00  C7  6D
+         ├───┘ └─┬─┘ └─┬─┘ └─┬─┘ └───┬───┘  └─┬──┘
+       Head  Length  Seq  Header   Body     Body CRC
+                          CRC (0-5) (Length + 2)
+    """
+    size = len(data)
+    if size < FRAME_OVERHEAD or data[0] != PACKET_HEAD[0]:
+        return False
+    if size != ((data[2] << 8) | data[3]) + FRAME_OVERHEAD:
+        return False
+
+    view = memoryview(data)
+    if crc16(view[:6]) != (data[6] << 8) | data[7]:
+        return False
+    return crc16(view[8:size - 2]) == (data[size - 2] << 8) | data[size - 1]
+
+
+class FrameReassembler:
+    """
+    Reassembles A5 framed packets from notifications that may hold a fragment
+    of a frame or several frames. The header length field decides how much to
+    buffer, and only frames passing both CRC checks are yielded. Bytes that
+    cannot start a valid header are discarded to resynchronize.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self.discarded = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    def reset(self):
+        self._buffer.clear()
+
+    def feed(self, data: Buffer) -> Iterator[memoryview]:
+        buf = self._buffer
+
+        # Fast Path - Exactly One Frame
+        if not buf and validate_frame(data):
+            yield memoryview(data)
+            return
+
+        buf += data
+        while buf:
+            # Sync To Head
+            start = buf.find(PACKET_HEAD[0])
+            if start < 0:
+                self.discarded += len(buf)
+                buf.clear()
+                return
+            if start > 0:
+                self.discarded += start
+                del buf[:start]
+
+            # Validate Header
+            if len(buf) < FRAME_HEADER_SIZE:
+                return
+            size = ((buf[2] << 8) | buf[3]) + FRAME_OVERHEAD
+            if size > MAX_FRAME_SIZE or crc16(buf[:6]) != (buf[6] << 8) | buf[7]:
+                self.discarded += 1
+                del buf[:1]
+                continue
+
+            # Wait For Remaining Fragments
+            if len(buf) < size:
+                return
+            frame = bytes(buf[:size])
+            del buf[:size]
+            if validate_frame(frame):
+                yield memoryview(frame)
+            else:
+                self.discarded += size
 
 
 def add_int16(d, i, j):
@@ -0,0 +1,62 @@
+from dataclasses import dataclass
+from typing import Any, Hashable, Mapping
+
+from .consts import CONF_TEMPERATURE_DEADBAND, CONF_TEMPERATURE_HEARTBEAT, CONF_TEMPERATURE_MIN_INTERVAL
+
+# Defaults - Hide 0.1°C Jitter, At Most One Write Per 10s, One Every 5m Regardless
+DEFAULT_DEADBAND = 0.1
+DEFAULT_MIN_INTERVAL = 10
+DEFAULT_HEARTBEAT = 300
+
+
+@dataclass(frozen=True)
+class PublishPolicy:
+    """
+    When a measured value is worth writing to Home Assistant. Zero disables
+    the respective limit.
+    """
+    deadband: float = DEFAULT_DEADBAND
+    min_interval: float = DEFAULT_MIN_INTERVAL
+    heartbeat: float = DEFAULT_HEARTBEAT
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> "PublishPolicy":
+        return cls(
+            deadband=options.get(CONF_TEMPERATURE_DEADBAND, DEFAULT_DEADBAND),
+            min_interval=options.get(CONF_TEMPERATURE_MIN_INTERVAL, DEFAULT_MIN_INTERVAL),
+            heartbeat=options.get(CONF_TEMPERATURE_HEARTBEAT, DEFAULT_HEARTBEAT),
+        )
+
+
+class PublishGate:
+    """
+    Tracks the last published value of an entity. Changes to its key (any
+    other rendered state) always publish; the measured value is held back
+    until it leaves the deadband and the minimum interval has passed, or the
+    heartbeat is due - which republishes even an unchanged value.
+    """
+
+    def __init__(self):
+        self._key: Hashable = None
+        self._value: float | None = None
+        self._time: float | None = None
+
+    def check(self, key: Hashable, value: float | None, policy: PublishPolicy, now: float) -> float | None:
+        """
+        Seconds until the value should be published - zero for now, None
+        when there is nothing to publish.
+        """
+        if self._time is None or key != self._key or value is None or self._value is None:
+            return 0
+
+        elapsed = now - self._time
+        if value != self._value and abs(value - self._value) >= policy.deadband:
+            return max(policy.min_interval - elapsed, 0)
+        if policy.heartbeat:
+            return max(policy.heartbeat - elapsed, 0)
+        return None
+
+    def published(self, key: Hashable, value: float | None, now: float) -> None:
+        self._key = key
+        self._value = value
+        self._time = now
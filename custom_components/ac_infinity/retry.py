@@ -0,0 +1,50 @@
+import random
+
+from dataclasses import dataclass
+
+MIN_RTO = 0.5
+MAX_RTO = 10
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    attempts: int
+    base_delay: float = 0.25
+    max_delay: float = 2
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Exponential backoff with full jitter before the given retry attempt.
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+NO_RETRY = RetryPolicy(attempts=1)
+IDEMPOTENT_RETRY = RetryPolicy(attempts=3)
+
+
+class RTTEstimator:
+    """
+    Response timeout estimation in the style of TCP (RFC 6298). Samples from
+    retried commands must not be fed in as the response may belong to either
+    attempt (Karn's algorithm).
+    """
+
+    def __init__(self, initial: float, min_rto: float = MIN_RTO, max_rto: float = MAX_RTO):
+        self.srtt: float | None = None
+        self.rttvar: float | None = None
+        self.rto = initial
+        self._min_rto = min_rto
+        self._max_rto = max_rto
+
+    def sample(self, rtt: float):
+        if self.srtt is None or self.rttvar is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = 0.75 * self.rttvar + 0.25 * abs(self.srtt - rtt)
+            self.srtt = 0.875 * self.srtt + 0.125 * rtt
+        self.rto = min(max(self.srtt + 4 * self.rttvar, self._min_rto), self._max_rto)
+
+    def backoff(self):
+        self.rto = min(self.rto * 2, self._max_rto)
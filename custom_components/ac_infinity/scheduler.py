@@ -0,0 +1,85 @@
+import asyncio
+import heapq
+import itertools
+import time
+
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+
+@dataclass
+class SchedulerStats:
+    max_depth: int = 0
+    collapsed_reads: int = 0
+    commands: dict[int, int] = field(default_factory=dict)
+    total_wait: dict[int, float] = field(default_factory=dict)
+    max_wait: dict[int, float] = field(default_factory=dict)
+
+    def record(self, priority: int, wait: float) -> None:
+        self.commands[priority] = self.commands.get(priority, 0) + 1
+        self.total_wait[priority] = self.total_wait.get(priority, 0) + wait
+        self.max_wait[priority] = max(self.max_wait.get(priority, 0), wait)
+
+    def mean_wait(self, priority: int) -> float | None:
+        if count := self.commands.get(priority):
+            return self.total_wait[priority] / count
+        return None
+
+
+class CommandScheduler:
+    """
+    Priority ordered command slots. At most `slots` commands hold a slot at
+    once; waiters are granted freed slots lowest priority value first and in
+    arrival order within a priority.
+    """
+
+    def __init__(self, slots: int):
+        self._free = slots
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._order = itertools.count()
+        self.stats = SchedulerStats()
+
+    @property
+    def depth(self) -> int:
+        return len(self._waiters)
+
+    @asynccontextmanager
+    async def slot(self, priority: int) -> AsyncIterator[None]:
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: int) -> None:
+        started = time.monotonic()
+        if self._free > 0 and not self._waiters:
+            self._free -= 1
+        else:
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            entry = (priority, next(self._order), future)
+            heapq.heappush(self._waiters, entry)
+            self.stats.max_depth = max(self.stats.max_depth, len(self._waiters))
+            try:
+                await future
+            except asyncio.CancelledError:
+                # Granted Then Cancelled - Hand The Slot On
+                if future.done() and not future.cancelled():
+                    self._release()
+                else:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+                raise
+        self.stats.record(priority, time.monotonic() - started)
+
+    def _release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._free += 1
@@ -1,12 +1,23 @@
-from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorEntityDescription, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfTemperature
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfTemperature, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .arbiter import AdapterStats
 from .consts import DOMAIN
 from .coordinator import ACICoordinator
 from .entity import ACIEntity
+from .device import FRAME_ADVERTISEMENT, FRAME_MODEL_DATA, FRAME_STATUS, ACIBluetoothDevice
+from .protocol import MODEL_DATA_REGISTERS
+from .publish import PublishGate
+
+# Link Metric Sensors Poll - Coordinator Pushed Entities Ignore This
+SCAN_INTERVAL = timedelta(seconds=60)
 
 
 async def async_setup_entry(
@@ -15,18 +26,156 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     coordinator: ACICoordinator = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities([TemperatureSensor(coordinator)])
+    async_add_entities([
+        TemperatureSensor(coordinator),
+        *(LinkMetricSensor(coordinator, description) for description in LINK_METRIC_SENSORS),
+    ])
+
+
+def _ms(value: float | None) -> float | None:
+    return round(value * 1000, 1) if value is not None else None
+
+
+def _percent(value: float | None) -> float | None:
+    return round(value * 100, 1) if value is not None else None
+
+
+def _adapter(device: ACIBluetoothDevice, value_fn: Callable[[AdapterStats], float | int | None]) -> float | int | None:
+    stats = device.client.adapter_stats
+    return value_fn(stats) if stats is not None else None
+
+
+@dataclass(frozen=True, kw_only=True)
+class LinkMetricSensorEntityDescription(SensorEntityDescription):
+    value_fn: Callable[[ACIBluetoothDevice], float | int | None]
+
+
+LINK_METRIC_SENSORS: tuple[LinkMetricSensorEntityDescription, ...] = (
+    LinkMetricSensorEntityDescription(
+        key="connects",
+        name="Connects",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda d: d.client.metrics.connect_time.count,
+    ),
+    LinkMetricSensorEntityDescription(
+        key="connect_time",
+        name="Connect Time",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda d: _ms(d.client.metrics.connect_time.last),
+    ),
+    LinkMetricSensorEntityDescription(
+        key="rtt_p50",
+        name="Response Time p50",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda d: _ms(d.client.metrics.rtt.quantile(0.5)),
+    ),
+    LinkMetricSensorEntityDescription(
+        key="rtt_p95",
+        name="Response Time p95",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda d: _ms(d.client.metrics.rtt.quantile(0.95)),
+    ),
+    LinkMetricSensorEntityDescription(
+        key="rtt_p99",
+        name="Response Time p99",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda d: _ms(d.client.metrics.rtt.quantile(0.99)),
+    ),
+    LinkMetricSensorEntityDescription(
+        key="timeouts",
+        name="Response Timeouts",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda d: d.client.metrics.timeouts,
+    ),
+    LinkMetricSensorEntityDescription(
+        key="unknown_sequence",
+        name="Unknown Sequence Responses",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda d: d.client.metrics.unknown_sequence,
+    ),
+    LinkMetricSensorEntityDescription(
+        key="notification_rate",
+        name="Notification Rate",
+        native_unit_of_measurement="notifications/min",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda d: d.client.metrics.notifications.per_minute,
+    ),
+    LinkMetricSensorEntityDescription(
+        key="advertisement_drop_rate",
+        name="Duplicate Advertisements",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda d: _percent(d.frame_cache.drop_rate(FRAME_ADVERTISEMENT)),
+    ),
+    LinkMetricSensorEntityDescription(
+        key="status_drop_rate",
+        name="Duplicate Status Notifications",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda d: _percent(d.frame_cache.drop_rate(FRAME_STATUS)),
+    ),
+    LinkMetricSensorEntityDescription(
+        key="model_data_drop_rate",
+        name="Unchanged Model Reads",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda d: _percent(d.frame_cache.drop_rate((FRAME_MODEL_DATA, tuple(MODEL_DATA_REGISTERS)))),
+    ),
+    LinkMetricSensorEntityDescription(
+        key="adapter_utilization",
+        name="Adapter Slot Utilization",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda d: _adapter(d, lambda s: _percent(s.utilization)),
+    ),
+    LinkMetricSensorEntityDescription(
+        key="adapter_connections",
+        name="Adapter Connections",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda d: _adapter(d, lambda s: s.connected),
+    ),
+    LinkMetricSensorEntityDescription(
+        key="adapter_waiting",
+        name="Adapter Slot Waiters",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda d: _adapter(d, lambda s: s.waiting),
+    ),
+    LinkMetricSensorEntityDescription(
+        key="adapter_max_wait",
+        name="Adapter Slot Wait (Max)",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda d: _adapter(d, lambda s: _ms(s.max_wait)),
+    ),
+    LinkMetricSensorEntityDescription(
+        key="adapter_preemptions",
+        name="Adapter Preemptions",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda d: _adapter(d, lambda s: s.preemptions),
+    ),
+)
 
 
 class TemperatureSensor(ACIEntity, SensorEntity):
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _state_fields = ("temperature",)
 
     def __init__(self, coordinator: ACICoordinator):
         super().__init__(coordinator)
         self._attr_name = f"Temperature"
         self._attr_unique_id = f"{self.coordinator.state.id}_temperature"
+        self._publish_gate = PublishGate()
 
     @property
     def available(self) -> bool:  # type: ignore
@@ -36,3 +185,26 @@ class TemperatureSensor(ACIEntity, SensorEntity):
     def _async_update_attrs(self) -> None:
         """Handle updating _attr values."""
         self._attr_native_value = self.coordinator.state.temperature
+
+    def _publish_value(self) -> float | None:
+        return self._attr_native_value
+
+
+class LinkMetricSensor(ACIEntity, SensorEntity):
+    # Metrics Change Without State Changes - Polled Instead
+    _attr_should_poll = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _state_fields = ()
+    entity_description: LinkMetricSensorEntityDescription
+
+    def __init__(self, coordinator: ACICoordinator, description: LinkMetricSensorEntityDescription):
+        self.entity_description = description
+        super().__init__(coordinator)
+        self._attr_name = description.name
+        self._attr_unique_id = f"{self.coordinator.state.id}_{description.key}"
+
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Handle updating _attr values."""
+        self._attr_native_value = self.entity_description.value_fn(self.coordinator.bt)
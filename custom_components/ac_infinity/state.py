@@ -1,5 +1,30 @@
+import time
+
 from dataclasses import dataclass
-from .models import DeviceMode, RampStatus
+from operator import attrgetter
+from typing import Any, Callable, Iterable
+
+from .models import DataSource, DeviceMode, RampStatus
+
+
+# Field Tuple -> Getter Returning Their Values As A Tuple
+_getters: dict[tuple[str, ...], Callable[[Any], tuple]] = {}
+
+
+def _getter(fields: tuple[str, ...]) -> Callable[[Any], tuple]:
+    if (getter := _getters.get(fields)) is not None:
+        return getter
+
+    # attrgetter Needs A Field & Returns A Single Field Bare
+    if not fields:
+        getter = lambda state: ()
+    elif len(fields) == 1:
+        key = fields[0]
+        getter = lambda state: (getattr(state, key),)
+    else:
+        getter = attrgetter(*fields)
+    _getters[fields] = getter
+    return getter
 
 
 @dataclass
@@ -42,6 +67,64 @@ class ACIDeviceState:
     timer_to_off_time: int | None = None
     timer_to_on_time: int | None = None
 
+    def __post_init__(self):
+        # Fields Of A Frame -> (Monotonic Update Time, Source) - Not Persisted
+        self._stamps: dict[tuple[str, ...], tuple[float, DataSource]] = {}
+        # Fields Changed Since Last Popped - Not Persisted
+        self._changed: set[str] = set()
+
+    def values(self, fields: tuple[str, ...]) -> tuple:
+        return _getter(fields)(self)
+
+    def pop_changes(self) -> set[str]:
+        changed = set(self._changed)
+        self._changed.clear()
+        return changed
+
+    def update(self, source: DataSource, fields: tuple[str, ...], values: tuple) -> None:
+        """
+        Apply the values one frame carries for fields, recording those whose
+        value changed, and mark the fields as just reported by source.
+        """
+        # Repeated Values Cost A Single Tuple Comparison
+        if (before := (_getters.get(fields) or _getter(fields))(self)) != values:
+            for key, old, new in zip(fields, before, values):
+                if old != new:
+                    setattr(self, key, new)
+                    self._changed.add(key)
+        self._stamps[fields] = (time.monotonic(), source)
+
+    def touch(self, source: DataSource, fields: tuple[str, ...]) -> None:
+        """
+        Mark fields as just reported by source without new values.
+        """
+        # One Stamp Per Frame - Fields Resolve To Their Latest Frame On Lookup
+        self._stamps[fields] = (time.monotonic(), source)
+
+    def _stamp(self, key: str) -> tuple[float, DataSource] | None:
+        latest = None
+        for fields, stamp in self._stamps.items():
+            if key in fields and (latest is None or stamp[0] >= latest[0]):
+                latest = stamp
+        return latest
+
+    def age(self, key: str) -> float | None:
+        if (entry := self._stamp(key)) is None:
+            return None
+        return time.monotonic() - entry[0]
+
+    def source(self, key: str) -> DataSource | None:
+        if (entry := self._stamp(key)) is None:
+            return None
+        return entry[1]
+
+    def is_fresh(self, fields: Iterable[str], max_age: float) -> bool:
+        for key in fields:
+            age = self.age(key)
+            if age is None or age >= max_age:
+                return False
+        return True
+
     def get_cycle_state(self) -> CycleState | None:
         if self.cycle_off_time is None or self.cycle_on_time is None:
             return None
@@ -58,9 +141,22 @@ class ACIDeviceState:
             low_temp=self.auto_low_temp
         )
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ACIDeviceState":
+        """
+        Restore persisted state - enums are serialized by value.
+        """
+        values = {key: value for key, value in data.items() if key in cls.__dataclass_fields__}
+        for key, enum in (("mode", DeviceMode), ("ramp_status", RampStatus)):
+            if values.get(key) is not None and not isinstance(values[key], enum):
+                values[key] = enum(values[key])
+        return cls(**values)
+
     def to_dict(self) -> dict:
         result = {}
         for key, value in self.__dict__.items():
+            if key.startswith('_'):
+                continue
             if hasattr(value, 'value'):
                 result[key] = str(value)
             else:
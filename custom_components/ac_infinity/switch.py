@@ -6,7 +6,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .consts import DOMAIN
 from .coordinator import ACICoordinator
-from .entity import ACIEntity
+from .entity import ACIEntity, command_action
 
 
 async def async_setup_entry(
@@ -24,15 +24,18 @@ async def async_setup_entry(
 class AutoHighTemperatureSwitch(ACIEntity, SwitchEntity):
     _attr_device_class = SwitchDeviceClass.SWITCH
     _attr_entity_category = EntityCategory.CONFIG
+    _state_fields = ("auto_high_temp_on",)
 
     def __init__(self, coordinator: ACICoordinator):
         super().__init__(coordinator)
         self._attr_name = "Auto High Temp Enabled"
         self._attr_unique_id = f"{self.coordinator.state.id}_auto_high_temp_enabled"
 
+    @command_action
     async def async_turn_on(self, **kwargs) -> None:
         await self.coordinator.bt.set_auto_high_switch(True)
 
+    @command_action
     async def async_turn_off(self, **kwargs) -> None:
         await self.coordinator.bt.set_auto_high_switch(False)
 
@@ -48,15 +51,18 @@ class AutoHighTemperatureSwitch(ACIEntity, SwitchEntity):
 class AutoLowTemperatureSwitch(ACIEntity, SwitchEntity):
     _attr_device_class = SwitchDeviceClass.SWITCH
     _attr_entity_category = EntityCategory.CONFIG
+    _state_fields = ("auto_low_temp_on",)
 
     def __init__(self, coordinator: ACICoordinator):
         super().__init__(coordinator)
         self._attr_name = "Auto Low Temp Enabled"
         self._attr_unique_id = f"{self.coordinator.state.id}_auto_low_temp_enabled"
 
+    @command_action
     async def async_turn_on(self, **kwargs) -> None:
         await self.coordinator.bt.set_auto_low_switch(True)
 
+    @command_action
     async def async_turn_off(self, **kwargs) -> None:
         await self.coordinator.bt.set_auto_low_switch(False)
 
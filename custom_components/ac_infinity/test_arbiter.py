@@ -0,0 +1,151 @@
+import asyncio
+
+from .arbiter import DEFAULT_ADAPTER, LOCAL_SLOTS, PROXY_SLOTS, ConnectionArbiter, adapter_of, slots_of
+from .conftest import FakeHolder
+from .scheduler import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE
+
+
+class TestAdapterOf:
+    def test_source(self):
+        assert adapter_of({"source": "AA:BB:CC:DD:EE:FF", "path": "/org/bluez/hci0"}) == "AA:BB:CC:DD:EE:FF"
+
+    def test_default(self):
+        assert adapter_of(None) == DEFAULT_ADAPTER
+        assert adapter_of({}) == DEFAULT_ADAPTER
+
+    def test_slots_by_adapter_type(self):
+        assert slots_of({"source": "hci0", "path": "/org/bluez/hci0/dev_AA"}) == LOCAL_SLOTS
+        assert slots_of({"source": "AA:BB:CC:DD:EE:FF"}) == PROXY_SLOTS
+        assert slots_of(None) == PROXY_SLOTS
+
+
+class TestConnectionArbiter:
+    def test_slot_limit(self):
+        async def run():
+            arbiter = ConnectionArbiter(slots=2)
+            a, b, c = (FakeHolder(arbiter, n) for n in "abc")
+            await arbiter.acquire(a)
+            await arbiter.acquire(b)
+            waiter = asyncio.create_task(arbiter.acquire(c))
+            await asyncio.sleep(0)
+            assert not waiter.done()
+            assert arbiter.stats["hci0"].waiting == 1
+
+            arbiter.release(a)
+            await waiter
+            return arbiter.stats["hci0"]
+
+        stats = asyncio.run(run())
+        assert stats.connected == 2
+        assert stats.grants == 3
+
+    def test_adapters_independent(self):
+        async def run():
+            arbiter = ConnectionArbiter(slots=1)
+            await arbiter.acquire(FakeHolder(arbiter, "a", "hci0"))
+            await asyncio.wait_for(arbiter.acquire(FakeHolder(arbiter, "b", "hci1")), 1)
+
+        asyncio.run(run())
+
+    def test_interactive_first(self):
+        async def run():
+            arbiter = ConnectionArbiter(slots=1)
+            a = FakeHolder(arbiter, "a")
+            await arbiter.acquire(a)
+
+            order: list[str] = []
+
+            async def acquire(holder: FakeHolder, priority: int):
+                await arbiter.acquire(holder, priority)
+                order.append(holder.name)
+                arbiter.release(holder)
+
+            tasks = [
+                asyncio.create_task(acquire(FakeHolder(arbiter, "poll"), PRIORITY_BACKGROUND)),
+                asyncio.create_task(acquire(FakeHolder(arbiter, "write"), PRIORITY_INTERACTIVE)),
+            ]
+            await asyncio.sleep(0)
+            arbiter.release(a)
+            await asyncio.gather(*tasks)
+            return order
+
+        assert asyncio.run(run()) == ["write", "poll"]
+
+    def test_preempts_idle(self):
+        async def run():
+            arbiter = ConnectionArbiter(slots=1)
+            a, b = FakeHolder(arbiter, "a"), FakeHolder(arbiter, "b")
+            a.is_idle = True
+            await arbiter.acquire(a)
+            await asyncio.wait_for(arbiter.acquire(b, PRIORITY_INTERACTIVE), 1)
+            return a, arbiter.stats["hci0"]
+
+        a, stats = asyncio.run(run())
+        assert a.preempted == 1
+        assert stats.preemptions == 1
+
+    def test_busy_preempted_once_idle(self):
+        async def run():
+            arbiter = ConnectionArbiter(slots=1)
+            a, b = FakeHolder(arbiter, "a"), FakeHolder(arbiter, "b")
+            await arbiter.acquire(a)
+            waiter = asyncio.create_task(arbiter.acquire(b))
+            await asyncio.sleep(0)
+            assert a.preempted == 0
+
+            a.is_idle = True
+            arbiter.idle(a)
+            await asyncio.wait_for(waiter, 1)
+            return a
+
+        assert asyncio.run(run()).preempted == 1
+
+    def test_cancelled_waiter(self):
+        async def run():
+            arbiter = ConnectionArbiter(slots=1)
+            a, b = FakeHolder(arbiter, "a"), FakeHolder(arbiter, "b")
+            await arbiter.acquire(a)
+            waiter = asyncio.create_task(arbiter.acquire(b))
+            await asyncio.sleep(0)
+            waiter.cancel()
+            await asyncio.sleep(0)
+            arbiter.release(a)
+            return arbiter.stats["hci0"]
+
+        stats = asyncio.run(run())
+        assert stats.connected == 0
+        assert stats.waiting == 0
+
+    def test_background_waiter_keeps_interactive_holder(self):
+        async def run():
+            arbiter = ConnectionArbiter(slots=1)
+            a, poll, write = FakeHolder(arbiter, "a"), FakeHolder(arbiter, "poll"), FakeHolder(arbiter, "write")
+            a.is_idle = True
+            await arbiter.acquire(a, PRIORITY_INTERACTIVE)
+            waiter = asyncio.create_task(arbiter.acquire(poll, PRIORITY_BACKGROUND))
+            await asyncio.sleep(0)
+            arbiter.idle(a)
+            preempted = a.preempted
+
+            await asyncio.wait_for(arbiter.acquire(write, PRIORITY_INTERACTIVE), 1)
+            waiter.cancel()
+            return preempted, a.preempted
+
+        assert asyncio.run(run()) == (0, 1)
+
+    def test_slots_per_adapter(self):
+        async def run():
+            arbiter = ConnectionArbiter()
+            for n in range(LOCAL_SLOTS):
+                await asyncio.wait_for(arbiter.acquire(FakeHolder(arbiter, f"local-{n}", "hci0", LOCAL_SLOTS)), 1)
+            for n in range(PROXY_SLOTS):
+                await asyncio.wait_for(arbiter.acquire(FakeHolder(arbiter, f"proxy-{n}", "proxy")), 1)
+            waiter = asyncio.create_task(arbiter.acquire(FakeHolder(arbiter, "proxy-extra", "proxy")))
+            await asyncio.sleep(0)
+            assert not waiter.done()
+            waiter.cancel()
+            return arbiter.stats
+
+        stats = asyncio.run(run())
+        assert stats["hci0"].slots == LOCAL_SLOTS
+        assert stats["proxy"].slots == PROXY_SLOTS
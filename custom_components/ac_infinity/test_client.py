@@ -0,0 +1,279 @@
+import asyncio
+import contextvars
+
+from .arbiter import ConnectionArbiter
+from . import client as client_module
+from .client import ConnectionPolicy
+from .conftest import FakeHolder, FakeServices, make_client, response_frame
+from .models import DeviceMode
+from .protocol import CMD_TYPE_READ, CMD_TYPE_WRITE, Protocol
+from .retry import RTTEstimator
+from .scheduler import PRIORITY_INTERACTIVE
+
+p = Protocol()
+
+
+class TestSequence:
+    def test_wraparound_skips_outstanding(self, ble):
+        async def run():
+            client = make_client()
+            client._seq = 0xFFFF
+            client._outstanding.add(0xFFFF, 5)
+            client._outstanding.add(0, 5)
+            seq = client._next_seq()
+            client._outstanding.cancel_all(ConnectionError())
+            return seq, client._seq
+
+        assert asyncio.run(run()) == (1, 2)
+
+    def test_low_byte_collision(self, ble):
+        async def run():
+            client = make_client()
+            low = client._outstanding.add(0x0001, 5)
+            high = client._outstanding.add(0x0101, 5)
+            client._handle_response(memoryview(response_frame(0x0101, [])))
+            await asyncio.sleep(0)
+            result = (low.done(), high.done(), client.metrics.unknown_sequence)
+            client._outstanding.cancel_all(ConnectionError())
+            return result
+
+        assert asyncio.run(run()) == (False, True, 0)
+
+    def test_window_limits_in_flight(self, ble):
+        ble.rtt = 0.01
+
+        async def run():
+            client = make_client(window=2)
+            await asyncio.gather(*(client.send(p.read_registers([register])) for register in (16, 17, 18, 19, 20)))
+            return client
+
+        client = asyncio.run(run())
+        assert ble.max_in_flight == 2
+        assert client.outstanding == 0
+
+
+class TestPriorityQueue:
+    def test_interactive_overtakes_queued_poll(self, ble):
+        ble.rtt = 0.01
+
+        async def run():
+            client = make_client(window=1)
+            busy = asyncio.create_task(client.send(p.read_registers([17])))
+            await asyncio.sleep(0.005)
+            poll = asyncio.create_task(client.send(p.get_model_data()))
+            await asyncio.sleep(0)
+            write = asyncio.create_task(client.send(p.set_mode(DeviceMode.ON)))
+            await asyncio.gather(busy, poll, write)
+
+        asyncio.run(run())
+        types = [data[9] for data, _ in ble.writes]
+        assert types == [CMD_TYPE_READ, CMD_TYPE_WRITE, CMD_TYPE_READ]
+
+    def test_duplicate_reads_collapse(self, ble):
+        ble.rtt = 0.01
+
+        async def run():
+            client = make_client(window=1)
+            busy = asyncio.create_task(client.send(p.read_registers([17])))
+            await asyncio.sleep(0.005)
+            polls = await asyncio.gather(client.send(p.get_model_data()), client.send(p.get_model_data()))
+            await busy
+            return client, polls
+
+        client, polls = asyncio.run(run())
+        assert client.queue_stats.collapsed_reads == 1
+        assert len(ble.writes) == 2
+        assert bytes(polls[0]) == bytes(polls[1])
+
+
+class TestClose:
+    def test_releases_slot(self, ble):
+        async def run():
+            arbiter = ConnectionArbiter(slots=1)
+            client = make_client(arbiter=arbiter, policy=ConnectionPolicy.ADAPTIVE)
+            await client.send(p.get_model_data())
+            connected = arbiter.stats[client.adapter].connected
+            await client.close()
+            return connected, arbiter.stats[client.adapter].connected
+
+        assert asyncio.run(run()) == (1, 0)
+        assert not ble.is_connected
+
+    def test_dropped_link_hands_slot_on(self, ble):
+        async def run():
+            arbiter = ConnectionArbiter(slots=1)
+            client = make_client(arbiter=arbiter, policy=ConnectionPolicy.ADAPTIVE)
+            other = FakeHolder(arbiter, "other", client.adapter)
+            async with client.lease():
+                await client.send(p.get_model_data())
+                waiter = asyncio.create_task(arbiter.acquire(other, PRIORITY_INTERACTIVE))
+                await asyncio.sleep(0)
+                assert not waiter.done()
+
+                ble.drop_link()
+                await asyncio.wait_for(waiter, 1)
+                holders = arbiter.stats[client.adapter].connected
+
+                # Later Release Of The Dropped Link Leaves The New Holder Alone
+                await client.close()
+                return holders, arbiter.stats[client.adapter].connected
+
+        assert asyncio.run(run()) == (1, 1)
+
+
+class TestReadiness:
+    def test_status_notification_skips_probe(self, ble):
+        async def run():
+            client = make_client()
+            await client.send(p.get_model_data())
+            return client
+
+        client = asyncio.run(run())
+        assert len(ble.writes) == 1
+        assert client.connection_stats.ready_timeouts == 0
+
+    def test_probe_reply_is_not_unknown(self, ble, monkeypatch):
+        monkeypatch.setattr(client_module, "READY_STATUS_WAIT", 0.01)
+        ble.status_on_notify = False
+
+        async def run():
+            client = make_client()
+            await client.send(p.get_model_data())
+            return client
+
+        client = asyncio.run(run())
+        assert len(ble.writes) == 2
+        assert client.connection_stats.ready_timeouts == 0
+        assert client.metrics.unknown_sequence == 0
+
+    def test_probe_timeout_continues(self, ble, monkeypatch):
+        monkeypatch.setattr(client_module, "READY_STATUS_WAIT", 0.01)
+        monkeypatch.setattr(client_module, "READY_TIMEOUT", 0.05)
+        ble.status_on_notify = False
+        ble.drop = 1
+
+        async def run():
+            client = make_client()
+            resp = await client.send(p.get_model_data())
+            return client, resp
+
+        client, resp = asyncio.run(run())
+        assert resp is not None
+        assert client.connection_stats.ready_timeouts == 1
+        assert client.outstanding == 0
+
+
+class TestIdlePolicy:
+    def idle_timeout(self, policy: ConnectionPolicy, gaps: list[float], connect_time: float | None) -> float | None:
+        async def run():
+            client = make_client(policy=policy, idle_timeout=30)
+            client._gaps.extend(gaps)
+            client.connection_stats.last_connect_time = connect_time
+            return client._get_idle_timeout()
+
+        return asyncio.run(run())
+
+    def test_fixed_policies(self, ble):
+        assert self.idle_timeout(ConnectionPolicy.ALWAYS, [10], 1) is None
+        assert self.idle_timeout(ConnectionPolicy.IDLE_TIMEOUT, [10], 1) == 30
+
+    def test_adaptive_without_history(self, ble):
+        assert self.idle_timeout(ConnectionPolicy.ADAPTIVE, [], None) == 30
+
+    def test_adaptive_keeps_link_for_frequent_commands(self, ble):
+        assert self.idle_timeout(ConnectionPolicy.ADAPTIVE, [10, 10, 12], 1) == 10 * 1.25 + 1
+
+    def test_adaptive_drops_link_for_rare_commands(self, ble):
+        assert self.idle_timeout(ConnectionPolicy.ADAPTIVE, [600], 1) == client_module.ADAPTIVE_MIN_IDLE
+
+    def test_adaptive_capped(self, ble):
+        assert self.idle_timeout(ConnectionPolicy.ADAPTIVE, [280], 10) == client_module.ADAPTIVE_MAX_IDLE
+
+
+class TestLease:
+    def test_holds_link_until_released(self, ble):
+        async def run():
+            client = make_client(idle_timeout=0.01)
+            async with client.lease():
+                await client.send(p.get_model_data())
+                await asyncio.sleep(0.05)
+                await client.send(p.set_mode(DeviceMode.ON))
+                held = ble.is_connected
+            await asyncio.sleep(0.05)
+            return client, held
+
+        client, held = asyncio.run(run())
+        assert held
+        assert ble.connects == 1
+        assert not ble.is_connected
+        assert client.connection_stats.idle_disconnects == 1
+
+    def test_other_tasks_take_connect_path(self, ble):
+        async def run():
+            client = make_client()
+            ensured = []
+            ensure_connected = client._ensure_connected
+
+            async def tracked(priority):
+                ensured.append(priority)
+                await ensure_connected(priority)
+
+            client._ensure_connected = tracked
+            async with client.lease():
+                ensured.clear()
+                await client.send(p.get_model_data())
+                # Tasks Started Within The Lease Share It, Unrelated Tasks Do Not
+                await asyncio.create_task(client.send(p.get_model_data()))
+                await asyncio.get_running_loop().create_task(
+                    client.send(p.get_model_data()), context=contextvars.Context())
+            return ensured
+
+        assert len(asyncio.run(run())) == 1
+
+    def test_nested_leases(self, ble):
+        async def run():
+            client = make_client(idle_timeout=0.01)
+            async with client.lease():
+                async with client.lease():
+                    await client.send(p.get_model_data())
+                await asyncio.sleep(0.05)
+                inner_released = ble.is_connected
+            return client, inner_released
+
+        client, inner_released = asyncio.run(run())
+        assert inner_released
+        assert client.is_idle
+
+
+class TestWriteWithoutResponse:
+    def test_unacknowledged_when_supported(self, ble):
+        async def run():
+            client = make_client(write_without_response=True)
+            return await client.send(p.get_model_data())
+
+        assert asyncio.run(run()) is not None
+        assert [response for _, response in ble.writes] == [False]
+
+    def test_acknowledged_when_unsupported(self, ble):
+        ble.services = FakeServices(["write", "notify"])
+
+        async def run():
+            client = make_client(write_without_response=True)
+            await client.send(p.get_model_data())
+
+        asyncio.run(run())
+        assert [response for _, response in ble.writes] == [True]
+
+    def test_falls_back_after_missed_replies(self, ble):
+        ble.drop = client_module.FAST_WRITE_MAX_MISSES
+
+        async def run():
+            client = make_client(write_without_response=True)
+            client.rtt = RTTEstimator(0.02, min_rto=0.01)
+            resp = await client.send(p.get_model_data())
+            return client, resp
+
+        client, resp = asyncio.run(run())
+        assert resp is not None
+        assert client.metrics.fast_write_fallbacks == 1
+        assert [response for _, response in ble.writes] == [False, False, True]
@@ -0,0 +1,74 @@
+import asyncio
+import logging
+
+from homeassistant.core import HomeAssistant
+
+from .conftest import REGISTER_VALUES, FakeBLEDevice, FakeClient
+from .coordinator import ACICoordinator
+from .state import ACIDeviceState
+
+
+def make_coordinator(**kwargs) -> ACICoordinator:
+    coordinator = ACICoordinator(
+        HomeAssistant("/tmp"), FakeBLEDevice(), ACIDeviceState(), logging.getLogger(__name__), **kwargs)
+    coordinator.bt.client = FakeClient()
+    coordinator._available = True
+    coordinator._last_service_info = object()
+    return coordinator
+
+
+class TestListenerFanOut:
+    def test_poll_notifies_changed_fields_only(self, monkeypatch):
+        async def run():
+            coordinator = make_coordinator()
+            calls = []
+            coordinator.async_add_listener(lambda: calls.append("all"))
+            coordinator.async_add_field_listener(lambda: calls.append("on_speed"), ["fan_speed_on"])
+            coordinator.async_add_field_listener(lambda: calls.append("temperature"), ["temperature"])
+            await coordinator.async_initial_refresh()
+            initial = list(calls)
+            calls.clear()
+
+            monkeypatch.setitem(REGISTER_VALUES, 18, [7])
+            await coordinator._async_poll()
+            return initial, calls
+
+        initial, calls = asyncio.run(run())
+        assert initial == ["all"]
+        assert calls == ["on_speed"]
+
+    def test_unchanged_poll_notifies_nobody(self):
+        async def run():
+            coordinator = make_coordinator()
+            await coordinator.async_initial_refresh()
+            calls = []
+            coordinator.async_add_listener(lambda: calls.append("all"))
+            coordinator.async_add_field_listener(lambda: calls.append("any"), None)
+            await coordinator._async_poll()
+            return calls
+
+        assert asyncio.run(run()) == []
+
+    def test_availability_change_notifies_all(self):
+        async def run():
+            coordinator = make_coordinator()
+            await coordinator.async_initial_refresh()
+            calls = []
+            coordinator.async_add_listener(lambda: calls.append("all"))
+            coordinator._available = False
+            coordinator.async_update_listeners()
+            coordinator.async_update_listeners()
+            return calls
+
+        assert asyncio.run(run()) == ["all"]
+
+
+class TestWriteMode:
+    def test_write_without_response_reaches_client(self):
+        async def run(**kwargs):
+            coordinator = ACICoordinator(
+                HomeAssistant("/tmp"), FakeBLEDevice(), ACIDeviceState(), logging.getLogger(__name__), **kwargs)
+            return coordinator.bt.client._write_without_response
+
+        assert not asyncio.run(run())
+        assert asyncio.run(run(write_without_response=True))
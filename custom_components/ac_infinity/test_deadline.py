@@ -0,0 +1,55 @@
+import asyncio
+
+from .deadline import DeadlineTracker
+
+
+class TestDeadlineTracker:
+    def test_resolve(self):
+        async def run():
+            tracker = DeadlineTracker[bytes](asyncio.get_running_loop())
+            future = tracker.add(1, 1)
+            assert 1 in tracker
+            assert tracker.resolve(1, b"ok")
+            assert not tracker.resolve(1, b"again")
+            result = await future
+            tracker.discard(1, future)
+            return result, len(tracker), tracker._timer
+
+        assert asyncio.run(run()) == (b"ok", 0, None)
+
+    def test_expires_in_deadline_order(self):
+        async def run():
+            tracker = DeadlineTracker[bytes](asyncio.get_running_loop())
+            slow = tracker.add(1, 0.2)
+            fast = tracker.add(2, 0.05)
+            results = await asyncio.gather(slow, fast, return_exceptions=True)
+            return results, tracker
+
+        (slow, fast), tracker = asyncio.run(run())
+        assert isinstance(slow, asyncio.TimeoutError)
+        assert isinstance(fast, asyncio.TimeoutError)
+        assert tracker.expired == 2
+        assert len(tracker) == 0
+
+    def test_single_timer(self):
+        async def run():
+            loop = asyncio.get_running_loop()
+            tracker = DeadlineTracker[bytes](loop)
+            futures = [tracker.add(seq, 1 + seq / 100) for seq in range(50)]
+            timer = tracker._timer
+            assert abs(timer.when() - (loop.time() + 1)) < 0.05
+            for seq, future in enumerate(futures):
+                tracker.resolve(seq, b"")
+                tracker.discard(seq, future)
+            return timer.cancelled(), tracker._timer
+
+        assert asyncio.run(run()) == (True, None)
+
+    def test_cancel_all(self):
+        async def run():
+            tracker = DeadlineTracker[bytes](asyncio.get_running_loop())
+            futures = [tracker.add(seq, 5) for seq in range(3)]
+            assert tracker.cancel_all(ConnectionError("disconnected")) == 3
+            return await asyncio.gather(*futures, return_exceptions=True)
+
+        assert all(isinstance(e, ConnectionError) for e in asyncio.run(run()))
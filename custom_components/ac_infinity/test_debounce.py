@@ -0,0 +1,74 @@
+import asyncio
+
+from .debounce import RegisterDebouncer
+from .models import CommandFailed
+
+
+class TestRegisterDebouncer:
+    def test_last_value_wins(self):
+        applied = []
+
+        async def apply(**values):
+            applied.append(values)
+
+        async def run():
+            debouncer = RegisterDebouncer(delay=0.01)
+            await asyncio.gather(
+                debouncer.submit(19, {"high_temp": 25}, apply),
+                debouncer.submit(19, {"high_temp": 26}, apply),
+                debouncer.submit(19, {"low_temp": 18}, apply),
+                debouncer.submit(22, {"cycle_on_time": 60}, apply),
+            )
+
+        asyncio.run(run())
+        assert sorted(applied, key=len) == [{"cycle_on_time": 60}, {"high_temp": 26, "low_temp": 18}]
+
+    def test_error_propagates_to_all(self):
+        async def apply(**values):
+            raise RuntimeError("failed")
+
+        async def run():
+            debouncer = RegisterDebouncer(delay=0.01)
+            return await asyncio.gather(
+                debouncer.submit(18, {"speed": 1}, apply),
+                debouncer.submit(18, {"speed": 2}, apply),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run())
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    def test_sequential_writes_not_merged(self):
+        applied = []
+
+        async def apply(**values):
+            applied.append(values)
+
+        async def run():
+            debouncer = RegisterDebouncer(delay=0.01)
+            await debouncer.submit(18, {"speed": 1}, apply)
+            await debouncer.submit(18, {"speed": 2}, apply)
+
+        asyncio.run(run())
+        assert applied == [{"speed": 1}, {"speed": 2}]
+
+    def test_cancel_fails_pending_and_applying(self):
+        started = asyncio.Event()
+
+        async def apply(**values):
+            started.set()
+            await asyncio.sleep(10)
+
+        async def run():
+            debouncer = RegisterDebouncer(delay=0.01)
+            applying = asyncio.create_task(debouncer.submit(18, {"speed": 1}, apply))
+            await started.wait()
+            pending = asyncio.create_task(debouncer.submit(19, {"high_temp": 25}, apply))
+            await asyncio.sleep(0)
+
+            await debouncer.cancel()
+            return await asyncio.gather(applying, pending, return_exceptions=True), debouncer
+
+        results, debouncer = asyncio.run(run())
+        assert all(isinstance(r, CommandFailed) for r in results)
+        assert not debouncer._tasks and not debouncer._pending
@@ -0,0 +1,126 @@
+from .decoder import DEVICE_MODES, RAMP_STATUSES, STATUS_DEVICE_MODES
+from .models import DeviceMode, RampStatus
+from .protocol import Protocol
+from .state import ACIDeviceState
+
+p = Protocol()
+
+STATUS = bytes([0x1E, 0xFF, 0x02, 0x09, 0x03, 0x0C, 0x00, 0x00,
+                0x07, 0xE4, 0x00, 0x00, 0x00, 0x00, 0x27, 0x10, 0x80, 0x32])
+ADVERTISEMENT = bytes([0xA4, 0xC1, 0x38, 0x5F, 0x42, 0x9B, 0x53, 0x34, 0x30, 0x42, 0x4D,
+                       0x03, 0x06, 0x00, 0x05, 0xCD, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00,
+                       0x00, 0x00, 0x00, 0x00, 0x00])
+
+
+class TestLookupTables:
+    def test_known_values(self):
+        for mode in DeviceMode:
+            assert DEVICE_MODES[mode.value] is mode
+        for ramp in RampStatus:
+            assert RAMP_STATUSES[ramp.value] is ramp
+
+    def test_defaults(self):
+        assert DEVICE_MODES[0] is None
+        assert DEVICE_MODES[255] is None
+        assert STATUS_DEVICE_MODES[9] is DeviceMode.OFF
+        assert RAMP_STATUSES[15] is RampStatus.NONE
+
+
+class TestProcessStatus:
+    def test_memoryview(self):
+        state = ACIDeviceState()
+        assert p.process_status(memoryview(bytearray(STATUS)), state)
+        assert state.temperature == 20.20
+        assert state.fan_speed == 3
+        assert state.ramp_status == RampStatus.UP
+        assert state.mode == DeviceMode.ON
+        assert state.is_farenheight is True
+
+    def test_invalid_enum_values(self):
+        data = bytearray(STATUS)
+        data[16] = 0x90
+        data[17] = 0x19
+        state = ACIDeviceState()
+        assert p.process_status(memoryview(data), state)
+        assert state.ramp_status == RampStatus.NONE
+        assert state.mode == DeviceMode.OFF
+
+    def test_invalid_length(self):
+        assert not p.process_status(memoryview(STATUS)[:17], ACIDeviceState())
+
+
+class TestProcessAdvertisement:
+    def test_memoryview(self):
+        state = ACIDeviceState()
+        assert p.process_advertisement(memoryview(ADVERTISEMENT), state)
+        assert state.id == "D-S40BM"
+        assert state.name == "AirTap (D-S40BM)"
+        assert state.model == "AirTap"
+        assert state.temperature == 14.85
+        assert state.fan_speed == 4
+
+    def test_unsupported_device_type(self):
+        data = bytearray(ADVERTISEMENT)
+        data[12] = 99
+        assert not p.process_advertisement(memoryview(data), ACIDeviceState())
+
+    def test_invalid_length(self):
+        assert not p.process_advertisement(ADVERTISEMENT + b"\x00", ACIDeviceState())
+
+
+MODEL_DATA = bytes.fromhex(
+    "A5 13 00 2A 00 03 37 D5 00 01 10 01 01 11 01 02 12 01 08 13 07 00 09 74 86 0C 79 8C "
+    "14 04 00 00 01 2C 15 04 00 00 01 2C 16 08 00 00 01 2C 00 00 01 2C 17 00 C7 6D"
+)
+
+
+def model_frame(body: bytes) -> bytes:
+    return bytes(10) + body + bytes(2)
+
+
+class TestProcessModelData:
+    def test_full_response(self):
+        state = ACIDeviceState()
+        assert p.process_model_data(memoryview(MODEL_DATA), state)
+        assert state.mode == DeviceMode.OFF
+        assert state.fan_speed_off == 2
+        assert state.fan_speed_on == 8
+        assert state.auto_high_temp_on is False
+        assert state.auto_low_temp_on is False
+        assert state.auto_high_temp == 0x74
+        assert state.auto_low_temp == 0x0C
+        assert state.timer_to_on_time == 300
+        assert state.timer_to_off_time == 300
+        assert state.cycle_on_time == 300
+        assert state.cycle_off_time == 300
+
+    def test_partial_response(self):
+        state = ACIDeviceState(fan_speed_on=3, cycle_on_time=60)
+        assert p.process_model_data(model_frame(bytes([19, 7, 0x0C, 0, 30, 0, 20, 0, 0])), state)
+        assert state.auto_high_temp_on is True
+        assert state.auto_low_temp_on is True
+        assert state.auto_high_temp == 30
+        assert state.auto_low_temp == 20
+        assert state.fan_speed_on == 3
+        assert state.cycle_on_time == 60
+        assert state.mode is None
+
+    def test_unknown_registers_skipped(self):
+        state = ACIDeviceState()
+        assert p.process_model_data(model_frame(bytes([99, 3, 1, 2, 3, 18, 1, 5])), state)
+        assert state.fan_speed_on == 5
+
+    def test_truncated_record_keeps_decoded(self):
+        state = ACIDeviceState()
+        assert p.process_model_data(model_frame(bytes([18, 1, 5, 22, 8, 0, 0])), state)
+        assert state.fan_speed_on == 5
+        assert state.cycle_on_time is None
+
+    def test_short_value_skipped(self):
+        state = ACIDeviceState()
+        assert not p.process_model_data(model_frame(bytes([22, 4, 0, 0, 1, 44])), state)
+        assert state.cycle_on_time is None
+
+    def test_empty(self):
+        assert not p.process_model_data(model_frame(bytes([23, 0])), ACIDeviceState())
+        assert not p.process_model_data(b"short", ACIDeviceState())
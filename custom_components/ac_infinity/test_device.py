@@ -0,0 +1,149 @@
+import asyncio
+
+import pytest
+
+from .conftest import STATUS_NOTIFICATION, make_device
+from .device import FRAME_ADVERTISEMENT, FRAME_STATUS
+from .models import CommandFailed, DeviceMode, Register
+from .protocol import CMD_TYPE_READ, CMD_TYPE_WRITE
+
+ADVERTISEMENT = bytes.fromhex("A4 C1 38 5F 42 9B 53 34 30 42 4D 03 06 00 05 CD 00 00 04 00 00 00 00 00 00 00 00")
+
+
+class TestWriteLifecycle:
+    def test_close_fails_queued_and_in_flight(self, ble):
+        async def run():
+            device = make_device()
+            device.client.gate = asyncio.Event()
+            in_flight = asyncio.create_task(device.set_mode(DeviceMode.ON))
+            await asyncio.sleep(0.1)
+            queued = asyncio.create_task(device.set_on_speed(5))
+            await asyncio.sleep(0)
+
+            await device.close()
+            return await asyncio.gather(in_flight, queued, return_exceptions=True), device
+
+        results, device = asyncio.run(run())
+        assert all(isinstance(r, CommandFailed) for r in results)
+        assert not device._tasks
+
+    def test_write_error_propagates(self, ble):
+        async def run():
+            device = make_device()
+            device.client.error = ConnectionError("link lost")
+            await device.set_mode(DeviceMode.ON)
+
+        with pytest.raises(ConnectionError):
+            asyncio.run(run())
+
+    def test_unanswered_optimistic_write_reads_back(self, ble):
+        async def run():
+            device = make_device(optimistic=True)
+            device.client.write_error = CommandFailed("no response")
+            with pytest.raises(CommandFailed):
+                await device.set_on_speed(5)
+            return device
+
+        device = asyncio.run(run())
+        assert [cmd.type for cmd in device.client.sent] == [CMD_TYPE_WRITE, CMD_TYPE_READ]
+        assert not device._unverified
+
+
+class TestGroupUpdates:
+    def test_concurrent_partial_updates_fold(self, ble):
+        async def run():
+            device = make_device()
+            await device.update_model_data()
+            await asyncio.gather(
+                device.update_auto(high_temp=31),
+                device.update_auto(low_temp=19),
+                device.set_auto_high_switch(False),
+            )
+            return device
+
+        device = asyncio.run(run())
+        writes = [cmd for cmd in device.client.sent if cmd.type == CMD_TYPE_WRITE]
+        assert len(writes) == 1
+        assert writes[0].values == {
+            "auto_high_temp_on": False,
+            "auto_low_temp_on": True,
+            "auto_high_temp": 31,
+            "auto_low_temp": 19,
+        }
+
+    def test_folded_callers_share_failure(self, ble):
+        async def run():
+            device = make_device()
+            device.client.write_error = ConnectionError("link lost")
+            return await asyncio.gather(
+                device.update_cycle(cycle_on_time=30),
+                device.update_cycle(cycle_off_time=90),
+                device.update_cycle(cycle_on_time=45),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run())
+        assert all(isinstance(r, ConnectionError) for r in results)
+
+    def test_later_changes_start_next_batch(self, ble):
+        async def run():
+            device = make_device(optimistic=True)
+            await device.update_cycle(cycle_on_time=30)
+            await device.update_cycle(cycle_off_time=90)
+            return device
+
+        device = asyncio.run(run())
+        writes = [cmd for cmd in device.client.sent if cmd.type == CMD_TYPE_WRITE]
+        assert [w.values for w in writes] == [
+            {"cycle_on_time": 30, "cycle_off_time": 120},
+            {"cycle_on_time": 30, "cycle_off_time": 90},
+        ]
+
+
+def status_frame(temperature: float, speed: int = 4, mode: DeviceMode = DeviceMode.ON) -> bytes:
+    frame = bytearray(STATUS_NOTIFICATION)
+    frame[8:10] = round(temperature * 100).to_bytes(2, "big")
+    frame[17] = (speed << 4) | mode.value
+    return bytes(frame)
+
+
+def advertisement_frame(temperature: float, speed: int = 4) -> bytes:
+    frame = bytearray(ADVERTISEMENT)
+    frame[14:16] = round(temperature * 100).to_bytes(2, "big")
+    frame[18] = speed
+    return bytes(frame)
+
+
+class TestFrameDedupe:
+    def test_status_after_advertisement_changed_temperature(self, ble):
+        async def run():
+            device = make_device()
+            device._update_from_status_data(status_frame(20.5))
+            device._update_from_advertisement_data(advertisement_frame(21.0))
+            device._update_from_status_data(status_frame(20.5))
+            return device.state
+
+        assert asyncio.run(run()).temperature == 20.5
+
+    def test_status_after_model_read_changed_mode(self, ble):
+        async def run():
+            device = make_device()
+            device._update_from_status_data(status_frame(20.5, mode=DeviceMode.OFF))
+            await device.read_registers([Register.MODE])
+            assert device.state.mode == DeviceMode.ON
+            device._update_from_status_data(status_frame(20.5, mode=DeviceMode.OFF))
+            return device.state
+
+        assert asyncio.run(run()).mode == DeviceMode.OFF
+
+    def test_agreeing_sources_still_dropped(self, ble):
+        async def run():
+            device = make_device()
+            for _ in range(3):
+                device._update_from_status_data(status_frame(20.5))
+                device._update_from_advertisement_data(advertisement_frame(20.5))
+            return device
+
+        device = asyncio.run(run())
+        assert device.frame_cache.counts[FRAME_STATUS].dropped == 2
+        assert device.frame_cache.counts[FRAME_ADVERTISEMENT].dropped == 2
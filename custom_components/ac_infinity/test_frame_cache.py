@@ -0,0 +1,43 @@
+from .frame_cache import FrameCache
+
+ADVERTISEMENT = bytes.fromhex("A4 C1 38 5F 42 9B 53 34 30 42 4D 03 06 00 05 CD 00 00 04 00 00 00 00 00 00 00 00")
+
+
+class TestFrameCache:
+    def test_duplicate_after_store(self):
+        cache = FrameCache()
+        assert not cache.is_duplicate("advertisement", ADVERTISEMENT)
+        cache.store("advertisement", memoryview(ADVERTISEMENT))
+        assert cache.is_duplicate("advertisement", bytearray(ADVERTISEMENT))
+        assert not cache.is_duplicate("advertisement", ADVERTISEMENT[:-1] + b"\x01")
+        assert cache.counts["advertisement"].seen == 3
+        assert cache.counts["advertisement"].dropped == 1
+        assert cache.drop_rate("advertisement") == 1 / 3
+
+    def test_unparsed_not_cached(self):
+        cache = FrameCache()
+        assert not cache.is_duplicate("status", b"bad")
+        assert not cache.is_duplicate("status", b"bad")
+
+    def test_kinds_independent(self):
+        cache = FrameCache()
+        cache.store(("model_data", (16,)), b"\x10\x01\x01")
+        assert not cache.is_duplicate(("model_data", (17,)), b"\x10\x01\x01")
+        assert cache.is_duplicate(("model_data", (16,)), memoryview(b"\x10\x01\x01"))
+        assert cache.drop_rate("status") is None
+
+    def test_invalidate(self):
+        cache = FrameCache()
+        cache.store("status", b"a")
+        cache.store("advertisement", b"b")
+        cache.invalidate("status")
+        assert not cache.is_duplicate("status", b"a")
+        assert cache.is_duplicate("advertisement", b"b")
+        cache.invalidate()
+        assert not cache.is_duplicate("advertisement", b"b")
+
+    def test_values_must_match(self):
+        cache = FrameCache()
+        cache.store("status", b"a", (20.5, 3))
+        assert cache.is_duplicate("status", b"a", (20.5, 3))
+        assert not cache.is_duplicate("status", b"a", (21.0, 3))
@@ -0,0 +1,35 @@
+from .metrics import Histogram, RateMeter
+
+
+class TestHistogram:
+    def test_empty(self):
+        h = Histogram()
+        assert h.quantile(0.5) is None
+        assert h.mean is None
+
+    def test_quantiles(self):
+        h = Histogram()
+        for _ in range(90):
+            h.record(0.03)
+        for _ in range(10):
+            h.record(0.4)
+        assert h.count == 100
+        assert 0.02 < h.quantile(0.5) <= 0.05
+        assert 0.2 < h.quantile(0.95) <= 0.4
+        assert h.quantile(0.99) <= h.max == 0.4
+        assert abs(h.mean - 0.067) < 1e-9
+
+    def test_overflow_bucket(self):
+        h = Histogram((0.1, 1))
+        h.record(5)
+        assert h.counts == [0, 0, 1]
+        assert 1 < h.quantile(0.99) <= 5
+
+
+class TestRateMeter:
+    def test_per_minute(self):
+        meter = RateMeter(window=30)
+        for _ in range(10):
+            meter.record()
+        assert meter.count == 10
+        assert meter.per_minute == 20
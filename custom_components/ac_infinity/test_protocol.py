@@ -1,7 +1,8 @@
 import pytest
 
 from .models import DeviceMode, DeviceNotSupported, RampStatus
-from .protocol import Protocol
+from .protocol import CommandPool, FrameReassembler, Protocol, build_command, merge_writes, validate_frame
+from .state import ACIDeviceState, AutoState
 
 p = Protocol()
 
@@ -140,3 +141,116 @@ class TestParseAdvertisementData:
 
         result = p.parse_advertisement(bytes(data))
         assert result.fan_speed == 15
+
+
+class TestCommandRegisters:
+    def test_read_registers(self):
+        cmd = p.read_registers([19])
+        assert cmd.command == [19]
+        assert cmd.registers == [19]
+        assert cmd.has_callbacks()
+
+    def test_write_registers(self):
+        cmd = p.set_mode(DeviceMode.ON)
+        cmd.add(p.set_on_speed(5))
+        cmd.add(p.set_mode(DeviceMode.OFF))
+        assert cmd.registers == [16, 18]
+
+
+class TestMergeWrites:
+    def test_last_write_wins(self):
+        cmd = merge_writes([p.set_on_speed(3), p.set_off_speed(1), p.set_on_speed(7)])
+        assert cmd.command == [17, 1, 1, 18, 1, 7]
+        assert cmd.registers == [17, 18]
+
+    def test_auto_register_last(self):
+        auto = AutoState(high_temp_on=True, low_temp_on=False, high_temp=30, low_temp=20)
+        cmd = merge_writes([p.set_auto(auto), p.set_mode(DeviceMode.AUTO_TEMP)])
+        assert cmd.command[:3] == [16, 1, DeviceMode.AUTO_TEMP.value]
+        assert cmd.command[3] == 19
+        assert cmd.registers == [16, 19]
+
+
+class TestApplyValues:
+    def test_apply_written_values(self):
+        state = ACIDeviceState()
+        cmd = p.set_mode(DeviceMode.ON)
+        cmd.add(p.set_auto(AutoState(high_temp_on=True, low_temp_on=False, high_temp=29.6, low_temp=20.2)))
+        assert cmd.apply_values(b"", state)
+        assert state.mode == DeviceMode.ON
+        assert state.auto_high_temp == 30
+        assert state.auto_low_temp == 20
+        assert state.auto_high_temp_on is True
+
+    def test_reads_have_no_values(self):
+        assert not p.get_model_data().apply_values(b"", ACIDeviceState())
+
+
+class TestCommandCompile:
+    def test_matches_build_command(self):
+        cmd = p.get_model_data()
+        for seq in (0, 1, 255, 256, 0xFFFF):
+            assert cmd.compile(seq) == build_command(bytes(cmd.command), cmd.type, seq)
+            assert validate_frame(cmd.compile(seq))
+
+    def test_reuses_buffer(self):
+        cmd = p.set_on_speed(4)
+        assert cmd.compile(1) is cmd.compile(2)
+
+    def test_add_invalidates_frame(self):
+        cmd = p.set_mode(DeviceMode.ON)
+        cmd.compile(1)
+        cmd.add(p.set_on_speed(4))
+        assert cmd.compile(1) == build_command(bytes([16, 1, 2, 18, 1, 4]), cmd.type, 1)
+
+
+class TestCommandPool:
+    def test_reuses_returned_command(self):
+        pool = CommandPool()
+        cmd = pool.take("poll", p.get_model_data)
+        pool.give("poll", cmd)
+        assert pool.take("poll", p.get_model_data) is cmd
+        assert (pool.hits, pool.misses) == (1, 1)
+
+    def test_in_flight_not_shared(self):
+        pool = CommandPool()
+        first = pool.take("poll", p.get_model_data)
+        assert pool.take("poll", p.get_model_data) is not first
+
+
+MODEL_DATA = bytes.fromhex(
+    "A5 13 00 2A 00 03 37 D5 00 01 10 01 01 11 01 02 12 01 08 13 07 00 09 74 86 0C 79 8C "
+    "14 04 00 00 01 2C 15 04 00 00 01 2C 16 08 00 00 01 2C 00 00 01 2C 17 00 C7 6D"
+)
+SET_MODE = bytes.fromhex("A5 00 00 03 00 00 F5 69 00 03 10 01 02 DA C0")
+
+
+class TestFrameReassembler:
+    def test_single_frame(self):
+        r = FrameReassembler()
+        assert [bytes(f) for f in r.feed(MODEL_DATA)] == [MODEL_DATA]
+        assert r.pending == 0
+
+    def test_fragmented(self):
+        r = FrameReassembler()
+        frames = []
+        for i in range(0, len(MODEL_DATA), 20):
+            frames += [bytes(f) for f in r.feed(MODEL_DATA[i:i + 20])]
+        assert frames == [MODEL_DATA]
+        assert r.pending == 0
+
+    def test_concatenated(self):
+        r = FrameReassembler()
+        assert [bytes(f) for f in r.feed(SET_MODE + MODEL_DATA + SET_MODE)] == [SET_MODE, MODEL_DATA, SET_MODE]
+
+    def test_resync_after_garbage(self):
+        r = FrameReassembler()
+        assert [bytes(f) for f in r.feed(b"\x01\xA5\x02" + SET_MODE)] == [SET_MODE]
+        assert r.discarded == 3
+
+    def test_corrupt_body_dropped(self):
+        corrupt = bytearray(MODEL_DATA)
+        corrupt[20] ^= 0xFF
+        r = FrameReassembler()
+        assert [bytes(f) for f in r.feed(bytes(corrupt) + SET_MODE)] == [SET_MODE]
+        assert r.discarded == len(MODEL_DATA)
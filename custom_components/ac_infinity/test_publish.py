@@ -0,0 +1,53 @@
+from .publish import PublishGate, PublishPolicy
+
+POLICY = PublishPolicy(deadband=0.5, min_interval=10, heartbeat=300)
+
+
+def published_gate(value: float, key=("on",)) -> PublishGate:
+    gate = PublishGate()
+    assert gate.check(key, value, POLICY, 0) == 0
+    gate.published(key, value, 0)
+    return gate
+
+
+class TestPublishGate:
+    def test_first_publishes(self):
+        assert PublishGate().check((), 21.0, POLICY, 0) == 0
+
+    def test_unchanged_waits_for_heartbeat(self):
+        gate = published_gate(21.0)
+        assert gate.check(("on",), 21.0, POLICY, 100) == 200
+        assert gate.check(("on",), 21.0, POLICY, 1000) == 0
+
+    def test_unchanged_without_heartbeat(self):
+        policy = PublishPolicy(deadband=0.5, min_interval=10, heartbeat=0)
+        assert published_gate(21.0).check(("on",), 21.0, policy, 1000) is None
+
+    def test_deadband_waits_for_heartbeat(self):
+        gate = published_gate(21.0)
+        assert gate.check(("on",), 21.2, POLICY, 100) == 200
+        assert gate.check(("on",), 21.2, POLICY, 300) == 0
+
+    def test_min_interval(self):
+        gate = published_gate(21.0)
+        assert gate.check(("on",), 22.0, POLICY, 4) == 6
+        assert gate.check(("on",), 22.0, POLICY, 10) == 0
+
+    def test_key_change_publishes(self):
+        gate = published_gate(21.0)
+        assert gate.check(("off",), 21.0, POLICY, 1) == 0
+
+    def test_missing_value_publishes(self):
+        gate = published_gate(21.0)
+        assert gate.check(("on",), None, POLICY, 1) == 0
+
+    def test_limits_disabled(self):
+        policy = PublishPolicy(deadband=0, min_interval=0, heartbeat=0)
+        gate = published_gate(21.0)
+        assert gate.check(("on",), 21.01, policy, 0.1) == 0
+
+
+class TestPublishPolicy:
+    def test_from_options(self):
+        assert PublishPolicy.from_options({}) == PublishPolicy()
+        assert PublishPolicy.from_options({"temperature_deadband": 1.0}).deadband == 1.0
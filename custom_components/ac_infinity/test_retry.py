@@ -0,0 +1,44 @@
+from .retry import MAX_RTO, MIN_RTO, NO_RETRY, RetryPolicy, RTTEstimator
+
+
+class TestRetryPolicy:
+    def test_backoff_bounds(self):
+        policy = RetryPolicy(attempts=5, base_delay=0.25, max_delay=1)
+        for _ in range(100):
+            assert 0 <= policy.backoff(1) <= 0.25
+            assert 0 <= policy.backoff(2) <= 0.5
+            assert 0 <= policy.backoff(4) <= 1
+
+    def test_no_retry(self):
+        assert NO_RETRY.attempts == 1
+
+
+class TestRTTEstimator:
+    def test_first_sample(self):
+        rtt = RTTEstimator(5)
+        rtt.sample(0.2)
+        assert rtt.srtt == 0.2
+        assert rtt.rttvar == 0.1
+        assert abs(rtt.rto - 0.6) < 1e-9
+
+    def test_converges(self):
+        rtt = RTTEstimator(5)
+        for _ in range(50):
+            rtt.sample(0.1)
+        assert abs(rtt.srtt - 0.1) < 1e-6
+        assert rtt.rto == MIN_RTO
+
+    def test_tracks_variance(self):
+        rtt = RTTEstimator(5)
+        for sample in [0.1, 0.9] * 10:
+            rtt.sample(sample)
+        assert rtt.rto > 0.9
+
+    def test_backoff_clamped(self):
+        rtt = RTTEstimator(5)
+        rtt.backoff()
+        assert rtt.rto == MAX_RTO
+        rtt.backoff()
+        assert rtt.rto == MAX_RTO
+        rtt.sample(0.2)
+        assert rtt.rto < MAX_RTO
@@ -0,0 +1,62 @@
+import asyncio
+
+from .models import DeviceMode
+from .protocol import Protocol
+from .scheduler import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, CommandScheduler
+
+p = Protocol()
+
+
+async def run_in_order(scheduler: CommandScheduler, requests: list[tuple[str, int]]) -> list[str]:
+    order: list[str] = []
+
+    async def run(name: str, priority: int):
+        async with scheduler.slot(priority):
+            order.append(name)
+            await asyncio.sleep(0.01)
+
+    async with scheduler.slot(PRIORITY_BACKGROUND):
+        tasks = [asyncio.create_task(run(name, priority)) for name, priority in requests]
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+    return order
+
+
+class TestCommandScheduler:
+    def test_interactive_first(self):
+        scheduler = CommandScheduler(1)
+        order = asyncio.run(run_in_order(scheduler, [
+            ("poll-1", PRIORITY_BACKGROUND),
+            ("poll-2", PRIORITY_BACKGROUND),
+            ("write-1", PRIORITY_INTERACTIVE),
+            ("write-2", PRIORITY_INTERACTIVE),
+        ]))
+        assert order == ["write-1", "write-2", "poll-1", "poll-2"]
+        assert scheduler.stats.max_depth == 4
+        assert scheduler.stats.commands == {PRIORITY_BACKGROUND: 3, PRIORITY_INTERACTIVE: 2}
+        assert scheduler.depth == 0
+
+    def test_cancelled_waiter(self):
+        async def run():
+            scheduler = CommandScheduler(1)
+            async with scheduler.slot(PRIORITY_BACKGROUND):
+                waiter = asyncio.create_task(scheduler._acquire(PRIORITY_INTERACTIVE))
+                await asyncio.sleep(0)
+                assert scheduler.depth == 1
+                waiter.cancel()
+                await asyncio.sleep(0)
+                assert scheduler.depth == 0
+            async with scheduler.slot(PRIORITY_BACKGROUND):
+                pass
+            return scheduler._free
+
+        assert asyncio.run(run()) == 1
+
+
+class TestCommandPriority:
+    def test_defaults(self):
+        assert p.set_mode(DeviceMode.ON).get_priority() == PRIORITY_INTERACTIVE
+        assert p.get_model_data().get_priority() == PRIORITY_BACKGROUND
+
+    def test_explicit(self):
+        assert p.read_registers([16], PRIORITY_INTERACTIVE).get_priority() == PRIORITY_INTERACTIVE
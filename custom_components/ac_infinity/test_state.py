@@ -0,0 +1,111 @@
+import json
+
+from dataclasses import asdict
+
+from .conftest import STATUS_NOTIFICATION
+from .models import DataSource, DeviceMode
+from .protocol import Protocol
+from .state import ACIDeviceState
+
+p = Protocol()
+
+ADVERTISEMENT = bytes.fromhex("A4 C1 38 5F 42 9B 53 34 30 42 4D 03 06 00 05 CD 00 00 04 00 00 00 00 00 00 00 00")
+MODEL_DATA = bytes.fromhex(
+    "A5 13 00 2A 00 03 37 D5 00 01 10 01 01 11 01 02 12 01 08 13 07 00 09 74 86 0C 79 8C "
+    "14 04 00 00 01 2C 15 04 00 00 01 2C 16 08 00 00 01 2C 00 00 01 2C 17 00 C7 6D"
+)
+
+
+def model_frame(body: bytes) -> bytes:
+    return bytes(10) + body + bytes(2)
+
+
+class TestFreshness:
+    def test_sources(self):
+        state = ACIDeviceState()
+        assert state.age("temperature") is None
+        p.process_advertisement(ADVERTISEMENT, state)
+        assert state.source("temperature") == DataSource.ADVERTISEMENT
+        p.process_status(STATUS_NOTIFICATION, state)
+        assert state.source("temperature") == DataSource.STATUS
+        assert state.source("mode") == DataSource.STATUS
+        p.process_model_data(MODEL_DATA, state)
+        assert state.source("cycle_on_time") == DataSource.MODEL_READ
+        assert state.source("mode") == DataSource.MODEL_READ
+
+    def test_overlapping_frames(self):
+        state = ACIDeviceState()
+        p.process_status(STATUS_NOTIFICATION, state)
+        p.process_advertisement(ADVERTISEMENT, state)
+        assert state.source("fan_speed") == DataSource.ADVERTISEMENT
+        assert state.source("ramp_status") == DataSource.STATUS
+        assert state.age("ramp_status") >= state.age("fan_speed")
+
+    def test_partial_read(self):
+        state = ACIDeviceState()
+        p.process_model_data(model_frame(bytes([18, 1, 5])), state)
+        assert state.is_fresh(["fan_speed_on"], 60)
+        assert not state.is_fresh(["fan_speed_on", "fan_speed_off"], 60)
+        assert not state.is_fresh(["fan_speed_on"], 0)
+
+    def test_not_persisted(self):
+        state = ACIDeviceState()
+        p.process_status(STATUS_NOTIFICATION, state)
+        assert "_stamps" not in state.to_dict()
+        assert ACIDeviceState(**asdict(state)) == state
+
+
+class TestChangeTracking:
+    def test_only_changed_fields(self):
+        state = ACIDeviceState()
+        p.process_status(STATUS_NOTIFICATION, state)
+        assert "temperature" in state.pop_changes()
+
+        p.process_status(STATUS_NOTIFICATION, state)
+        assert state.pop_changes() == set()
+
+        data = bytearray(STATUS_NOTIFICATION)
+        data[9] += 1
+        p.process_status(data, state)
+        assert state.pop_changes() == {"temperature"}
+
+    def test_sources(self):
+        state = ACIDeviceState()
+        p.process_advertisement(ADVERTISEMENT, state)
+        assert state.pop_changes() == {"id", "name", "model", "fan_speed", "temperature"}
+
+        p.process_model_data(model_frame(bytes([16, 1, 2, 18, 1, 5])), state)
+        assert state.pop_changes() == {"mode", "fan_speed_on"}
+
+        p.process_model_data(model_frame(bytes([16, 1, 2, 18, 1, 5])), state)
+        assert state.pop_changes() == set()
+
+        cmd = p.set_mode(DeviceMode.OFF)
+        cmd.apply_values(b"", state)
+        assert state.pop_changes() == {"mode"}
+
+    def test_touch_without_values(self):
+        state = ACIDeviceState(temperature=20.0)
+        state.touch(DataSource.STATUS, ("temperature",))
+        assert state.pop_changes() == set()
+        assert state.source("temperature") == DataSource.STATUS
+
+    def test_not_persisted(self):
+        state = ACIDeviceState()
+        p.process_status(STATUS_NOTIFICATION, state)
+        assert "_changed" not in state.to_dict()
+        assert ACIDeviceState(**asdict(state)) == state
+
+
+class TestRestore:
+    def test_round_trip(self):
+        state = ACIDeviceState()
+        p.process_advertisement(ADVERTISEMENT, state)
+        p.process_status(STATUS_NOTIFICATION, state)
+        data = json.loads(json.dumps(asdict(state), default=lambda e: e.value))
+        restored = ACIDeviceState.from_dict(data)
+        assert restored == state
+        assert isinstance(restored.mode, DeviceMode)
+
+    def test_unknown_keys(self):
+        assert ACIDeviceState.from_dict({"temperature": 21.5, "removed": 1}).temperature == 21.5
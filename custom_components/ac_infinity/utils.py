@@ -1,3 +1,6 @@
-def format_as_hex(data: bytes) -> str:
+Buffer = bytes | bytearray | memoryview
+
+
+def format_as_hex(data: Buffer) -> str:
     hex_data = data.hex().upper()
     return ' '.join(hex_data[i:i+2]for i in range(0, len(hex_data), 2))